@@ -1,15 +1,25 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
+import pyarrow as pa
+from pandas.tseries.api import guess_datetime_format
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime
+import codecs
+import hashlib
+import io
 import os
 from pathlib import Path
 import re
 from collections import Counter
+from functools import lru_cache
 
 # Import mappings
-from mappings import account_to_vertical, account_name_variations
+from mappings import account_to_vertical, resolve_account
+
+# Vertical filter options: 'All' plus every vertical in the mapping, which is static configuration
+VERTICAL_OPTIONS = ['All'] + sorted(set(account_to_vertical.values()))
 
 # Month key -> (year, month) for chronological sort (most recent first)
 MONTH_TO_YEAR_MONTH = {
@@ -36,135 +46,139 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for better styling
-st.markdown("""
-<style>
-    .metric-card {
-        background-color: #f0f2f6;
-        padding: 20px;
-        border-radius: 10px;
-        border-left: 5px solid #1f77b4;
-        margin: 10px 0;
-    }
-    .account-card {
-        background-color: white;
-        padding: 20px;
-        border-radius: 10px;
-        border: 2px solid #e0e0e0;
-        margin: 10px 0;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-    }
-    .account-card-no-data {
-        background-color: #f9f9f9;
-        padding: 20px;
-        border-radius: 10px;
-        border: 2px dashed #cccccc;
-        margin: 10px 0;
-        text-align: center;
-        color: #666;
-    }
-    .vertical-badge {
-        display: inline-block;
-        padding: 5px 10px;
-        border-radius: 15px;
-        font-size: 12px;
-        font-weight: bold;
-        margin: 5px 0;
-    }
-    .score-high { color: #28a745; font-weight: bold; font-size: 24px; }
-    .score-medium { color: #ffc107; font-weight: bold; font-size: 24px; }
-    .score-low { color: #dc3545; font-weight: bold; font-size: 24px; }
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 24px;
-    }
-    .stTabs [data-baseweb="tab"] {
-        padding: 10px 20px;
-    }
-    
-</style>
-""", unsafe_allow_html=True)
+# Streamlit drops elements a rerun doesn't emit, so the style block is sent every run; it is built only once
+@st.cache_resource
+def _load_css():
+    """Custom CSS for better styling, read once from assets/dashboard.css and wrapped in its style tag"""
+    return f"<style>\n{(Path(__file__).parent / 'assets' / 'dashboard.css').read_text(encoding='utf-8')}</style>"
 
-def clean_text(text):
-    """Clean up encoding issues in text"""
-    if pd.isna(text) or not isinstance(text, str):
-        return text
-    
-    # Replace common encoding issues with proper characters
-    replacements = {
-        '�': "'",  # Replace � with regular apostrophe
-        '\x92': "'",  # Another apostrophe variant
-        '\x93': '"',  # Opening smart quote
-        '\x94': '"',  # Closing smart quote
-        '\x96': '–',  # En dasha
-        '\x97': '—',  # Em dash
-        '\x91': "'",  # Left single quote
-        '\u2018': "'",  # Left single quotation mark
-        '\u2019': "'",  # Right single quotation mark
-        '\u201c': '"',  # Left double quotation mark
-        '\u201d': '"',  # Right double quotation mark
-        '\u2013': '–',  # En dash
-        '\u2014': '—',  # Em dash
-    }
-    
-    for old, new in replacements.items():
-        text = text.replace(old, new)
-    
-    return text
+st.markdown(_load_css(), unsafe_allow_html=True)
+
+# Encoding artifacts -> proper characters, applied to whole text columns with str.translate
+CLEAN_TABLE = str.maketrans({
+    '\ufffd': "'",  # Replace � with regular apostrophe
+    '\x92': "'",  # Another apostrophe variant
+    '\x93': '"',  # Opening smart quote
+    '\x94': '"',  # Closing smart quote
+    '\x96': '–',  # En dash
+    '\x97': '—',  # Em dash
+    '\x91': "'",  # Left single quote
+    '\u2018': "'",  # Left single quotation mark
+    '\u2019': "'",  # Right single quotation mark
+    '\u201c': '"',  # Left double quotation mark
+    '\u201d': '"',  # Right double quotation mark
+})
+
+# Any character CLEAN_TABLE replaces; most columns have none, so they are left as they are
+CLEAN_CHARS_RE = re.compile('[' + re.escape(''.join(map(chr, CLEAN_TABLE))) + ']')
+
+def clean_text_columns(df):
+    """Clean encoding issues in every text column (vectorized, NaN-safe)"""
+    for col in df.select_dtypes(include='object').columns:
+        # One regex scan over the column's joined text is much cheaper than a per-cell check
+        if CLEAN_CHARS_RE.search(''.join(df[col].dropna().astype(str))):
+            df[col] = df[col].str.translate(CLEAN_TABLE)
+    return df
+
+# Month files follow the pattern: MonthName_YYYY_Scorecards.csv
+MONTH_FILE_PATTERN = re.compile(r'(\w+)_(\d{4})_Scorecards\.csv', re.IGNORECASE)
 
 def get_available_months():
-    """Detect available month CSV files"""
-    scorecards_dir = Path("Scorecards")
+    """Detect available month CSV files; cached until files are added to or removed from Scorecards"""
+    return _get_available_months(_scorecards_dir_mtime())
+
+@st.cache_data(ttl=24 * 60 * 60)  # Keyed on the folder mtime, so the TTL only bounds memory
+def _get_available_months(scorecards_mtime):
+    """Scan the Scorecards folder for month CSV files"""
     months = []
     
-    # Look for files matching pattern: MonthName_YYYY_Scorecards.csv
-    pattern = re.compile(r'(\w+)_(\d{4})_Scorecards\.csv', re.IGNORECASE)
+    # Single directory pass: collect file names and match month files
+    try:
+        with os.scandir("Scorecards") as entries:
+            file_names = {entry.name for entry in entries if entry.is_file()}
+    except FileNotFoundError:
+        file_names = set()
     
-    for file in scorecards_dir.glob("*_*_Scorecards.csv"):
-        match = pattern.match(file.name)
-        if match:
+    for name in file_names:
+        match = MONTH_FILE_PATTERN.match(name)
+        if match and name.endswith("_Scorecards.csv"):
             month_name, year = match.groups()
             months.append(f"{month_name}_{year}")
     
     # Also check for legacy files (current format)
-    legacy_files = list(scorecards_dir.glob("Scorecard Review Executive Summary*.csv"))
-    if legacy_files:
+    has_legacy_files = any(
+        name.startswith("Scorecard Review Executive Summary") and name.endswith(".csv")
+        for name in file_names
+    )
+    if has_legacy_files:
         # Check for file (17) first (newest), then (16), (15), (14), (13) - contains December 2025, January 2026, February 2026
-        file_17 = scorecards_dir / "Scorecard Review Executive Summary(Sheet1) (17).csv"
-        file_16 = scorecards_dir / "Scorecard Review Executive Summary(Sheet1) (16).csv"
-        file_15 = scorecards_dir / "Scorecard Review Executive Summary(Sheet1) (15).csv"
-        file_14 = scorecards_dir / "Scorecard Review Executive Summary(Sheet1) (14).csv"
-        file_13 = scorecards_dir / "Scorecard Review Executive Summary(Sheet1) (13).csv"
-        file_ls = scorecards_dir / "Scorecard Review Executive Summary(1-59).csv"  # Life science (Feb)
-        file_12 = scorecards_dir / "Scorecard Review Executive Summary(Sheet1) (12).csv"
-        if file_17.exists() or file_16.exists() or file_15.exists() or file_14.exists() or file_13.exists():
+        file_17 = "Scorecard Review Executive Summary(Sheet1) (17).csv"
+        file_16 = "Scorecard Review Executive Summary(Sheet1) (16).csv"
+        file_15 = "Scorecard Review Executive Summary(Sheet1) (15).csv"
+        file_14 = "Scorecard Review Executive Summary(Sheet1) (14).csv"
+        file_13 = "Scorecard Review Executive Summary(Sheet1) (13).csv"
+        file_ls = "Scorecard Review Executive Summary(1-59).csv"  # Life science (Feb)
+        file_12 = "Scorecard Review Executive Summary(Sheet1) (12).csv"
+        if file_17 in file_names or file_16 in file_names or file_15 in file_names or file_14 in file_names or file_13 in file_names:
             if "February_2026" not in months:
                 months.append("February_2026")
             if "January_2026" not in months:
                 months.append("January_2026")
             if "December_2025" not in months:
                 months.append("December_2025")
-        if file_ls.exists():
+        if file_ls in file_names:
             if "February_2026" not in months:
                 months.append("February_2026")
-        elif file_12.exists() and "December_2025" not in months:
+        elif file_12 in file_names and "December_2025" not in months:
             months.append("December_2025")
-        elif not file_12.exists():
-            file_11 = scorecards_dir / "Scorecard Review Executive Summary(Sheet1) (11).csv"
-            if file_11.exists() and "December_2025" not in months:
+        elif file_12 not in file_names:
+            file_11 = "Scorecard Review Executive Summary(Sheet1) (11).csv"
+            if file_11 in file_names and "December_2025" not in months:
                 months.append("December_2025")
-            elif not file_11.exists():
-                file_10 = scorecards_dir / "Scorecard Review Executive Summary(Sheet1) (10).csv"
-                if file_10.exists() and "December_2025" not in months:
+            elif file_11 not in file_names:
+                file_10 = "Scorecard Review Executive Summary(Sheet1) (10).csv"
+                if file_10 in file_names and "December_2025" not in months:
                     months.append("December_2025")
         # Check for file (8) - November 2025
-        file_8 = scorecards_dir / "Scorecard Review Executive Summary(Sheet1) (8).csv"
-        if file_8.exists() and "November_2025" not in months:
+        file_8 = "Scorecard Review Executive Summary(Sheet1) (8).csv"
+        if file_8 in file_names and "November_2025" not in months:
             months.append("November_2025")
         # Fallback: if no specific files found, add November 2025
         elif "November_2025" not in months and "December_2025" not in months:
             months.append("November_2025")
     
-    return sorted(months, key=_month_sort_key, reverse=True)  # Most recent first
+    return tuple(sorted(months, key=_month_sort_key, reverse=True))  # Most recent first
+
+def parse_dates(values):
+    """Parse a date column with one explicit format, guessed from the first value (as pandas does),
+    so unique strings are parsed once on the fast path; per-value parsing only if no format fits"""
+    non_null = values.dropna()
+    fmt = guess_datetime_format(str(non_null.iloc[0])) if len(non_null) else None
+    return pd.to_datetime(values, errors='coerce', format=fmt or 'mixed', cache=True)
+
+def _detect_encoding(raw):
+    """Text encoding of raw CSV bytes: from the BOM if there is one, else UTF-8 if they decode as it, else cp1252.
+    Excel's non-UTF-8 exports are Windows-1252; statistical guessing misreads short files (e.g. as cp1250)"""
+    if raw.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+    if raw.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return 'utf-16'  # Excel's "Unicode Text" export; the codec reads the BOM for byte order
+    try:
+        raw.decode('utf-8')
+    except UnicodeDecodeError:
+        return 'cp1252'
+    return 'utf-8'
+
+def read_scorecard_csv(csv_path):
+    """Read a scorecard CSV once with the detected encoding and PyArrow engine.
+    Anything PyArrow can't parse is retried with the default engine in the same encoding; if that fails too,
+    the ParserError / UnicodeDecodeError is raised rather than decoding the bytes as something else"""
+    raw = Path(csv_path).read_bytes()
+    encoding = _detect_encoding(raw)
+    try:
+        return pd.read_csv(io.BytesIO(raw), encoding=encoding, engine='pyarrow')
+    except (pa.ArrowException, pd.errors.ParserError):
+        return pd.read_csv(io.BytesIO(raw), encoding=encoding)
 
 def _load_and_normalize_supplemental_csv(csv_path, month, main_df_columns):
     """Load a supplemental CSV (same format as 1-59 or 2(Sheet1)), filter by conduct month, normalize to main schema. Returns DataFrame or None."""
@@ -174,21 +188,13 @@ def _load_and_normalize_supplemental_csv(csv_path, month, main_df_columns):
     target_year, target_month = conduct if conduct else (None, None)
     if target_month is None:
         return None
-    encodings = ['utf-8', 'latin-1', 'iso-8859-1', 'cp1252', 'windows-1252']
-    for enc in encodings:
-        try:
-            df_sup = pd.read_csv(csv_path, encoding=enc)
-            for col in df_sup.columns:
-                if df_sup[col].dtype == 'object':
-                    df_sup[col] = df_sup[col].apply(clean_text)
-            break
-        except (UnicodeDecodeError, Exception):
-            continue
-    else:
+    try:
+        df_sup = clean_text_columns(read_scorecard_csv(csv_path))
+    except Exception:
         return None
     if 'Start time' not in df_sup.columns or len(df_sup) == 0:
         return None
-    start_series = pd.to_datetime(df_sup['Start time'], errors='coerce')
+    start_series = parse_dates(df_sup['Start time'])
     mask = start_series.notna() & (start_series.dt.year == target_year) & (start_series.dt.month == target_month)
     df_sup = df_sup[mask].copy()
     if len(df_sup) == 0:
@@ -205,196 +211,189 @@ def _load_and_normalize_supplemental_csv(csv_path, month, main_df_columns):
     df_sup = df_sup.reindex(columns=main_df_columns)
     return df_sup
 
-@st.cache_data(ttl=60)  # Cache for 60 seconds only
-def load_data(month=None):
-    """Load and process the CSV data with caching"""
+# Legacy export files per month key, newest first. (17)..(10) are the same export
+# and contain December 2025, January 2026 and February 2026
+_NEW_FORMAT_LEGACY_FILES = tuple(
+    f"Scorecard Review Executive Summary(Sheet1) ({n}).csv" for n in (17, 16, 15, 14, 13, 12, 11, 10)
+)
+LEGACY_CSV_FILES = {
+    "December_2025": _NEW_FORMAT_LEGACY_FILES,
+    "January_2026": _NEW_FORMAT_LEGACY_FILES,
+    "February_2026": _NEW_FORMAT_LEGACY_FILES,
+    "November_2025": (
+        "Scorecard Review Executive Summary(Sheet1) (8).csv",
+        "Scorecard Review Executive Summary(Sheet1) (5).csv",
+    ),
+}
+
+def _scorecards_dir_mtime():
+    """Modification time of the Scorecards folder - changes when files are added or removed"""
+    try:
+        return os.stat("Scorecards").st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+@lru_cache(maxsize=32)
+def _resolve_csv_path(month, scorecards_mtime=None):
+    """Resolve the CSV file to load for a month key (None = latest available).
+    scorecards_mtime is only part of the cache key, so lookups refresh when the folder changes."""
     scorecards_dir = Path("Scorecards")
-    
-    if month:
-        # Load specific month file
-        if month in ("December_2025", "January_2026", "February_2026"):
-            # Same CSV: (17) newest, then (16), (15), (14), (13), (12), (11), (10)
-            legacy_path_17 = Path("Scorecards/Scorecard Review Executive Summary(Sheet1) (17).csv")
-            legacy_path_16 = Path("Scorecards/Scorecard Review Executive Summary(Sheet1) (16).csv")
-            legacy_path_15 = Path("Scorecards/Scorecard Review Executive Summary(Sheet1) (15).csv")
-            legacy_path_14 = Path("Scorecards/Scorecard Review Executive Summary(Sheet1) (14).csv")
-            legacy_path_13 = Path("Scorecards/Scorecard Review Executive Summary(Sheet1) (13).csv")
-            legacy_path_12 = Path("Scorecards/Scorecard Review Executive Summary(Sheet1) (12).csv")
-            legacy_path_11 = Path("Scorecards/Scorecard Review Executive Summary(Sheet1) (11).csv")
-            legacy_path_10 = Path("Scorecards/Scorecard Review Executive Summary(Sheet1) (10).csv")
-            if legacy_path_17.exists():
-                csv_path = legacy_path_17
-            elif legacy_path_16.exists():
-                csv_path = legacy_path_16
-            elif legacy_path_15.exists():
-                csv_path = legacy_path_15
-            elif legacy_path_14.exists():
-                csv_path = legacy_path_14
-            elif legacy_path_13.exists():
-                csv_path = legacy_path_13
-            elif legacy_path_12.exists():
-                csv_path = legacy_path_12
-            elif legacy_path_11.exists():
-                csv_path = legacy_path_11
-            elif legacy_path_10.exists():
-                csv_path = legacy_path_10
-            else:
-                csv_path = scorecards_dir / f"{month}_Scorecards.csv"
-        elif month == "November_2025":
-            # Check for legacy file format first - try file (8) first, then (5), then new format
-            legacy_path_8 = Path("Scorecards/Scorecard Review Executive Summary(Sheet1) (8).csv")
-            legacy_path_5 = Path("Scorecards/Scorecard Review Executive Summary(Sheet1) (5).csv")
-            if legacy_path_8.exists():
-                csv_path = legacy_path_8
-            elif legacy_path_5.exists():
-                csv_path = legacy_path_5
-            else:
-                csv_path = scorecards_dir / f"{month}_Scorecards.csv"
-        else:
-            csv_path = scorecards_dir / f"{month}_Scorecards.csv"
-    else:
+    if month is None:
         # Default: try to find latest month or fallback to current file
-            available_months = get_available_months()
-            if available_months:
-                month_key = available_months[0]
-                if month_key in ("December_2025", "January_2026", "February_2026"):
-                    # Same CSV: (17) newest, then (16), (15), (14), (13), (12), (11), (10)
-                    legacy_path_17 = Path("Scorecards/Scorecard Review Executive Summary(Sheet1) (17).csv")
-                    legacy_path_16 = Path("Scorecards/Scorecard Review Executive Summary(Sheet1) (16).csv")
-                    legacy_path_15 = Path("Scorecards/Scorecard Review Executive Summary(Sheet1) (15).csv")
-                    legacy_path_14 = Path("Scorecards/Scorecard Review Executive Summary(Sheet1) (14).csv")
-                    legacy_path_13 = Path("Scorecards/Scorecard Review Executive Summary(Sheet1) (13).csv")
-                    legacy_path_12 = Path("Scorecards/Scorecard Review Executive Summary(Sheet1) (12).csv")
-                    legacy_path_11 = Path("Scorecards/Scorecard Review Executive Summary(Sheet1) (11).csv")
-                    legacy_path_10 = Path("Scorecards/Scorecard Review Executive Summary(Sheet1) (10).csv")
-                    if legacy_path_17.exists():
-                        csv_path = legacy_path_17
-                    elif legacy_path_16.exists():
-                        csv_path = legacy_path_16
-                    elif legacy_path_15.exists():
-                        csv_path = legacy_path_15
-                    elif legacy_path_14.exists():
-                        csv_path = legacy_path_14
-                    elif legacy_path_13.exists():
-                        csv_path = legacy_path_13
-                    elif legacy_path_12.exists():
-                        csv_path = legacy_path_12
-                    elif legacy_path_11.exists():
-                        csv_path = legacy_path_11
-                    elif legacy_path_10.exists():
-                        csv_path = legacy_path_10
-                    else:
-                        csv_path = scorecards_dir / f"{month_key}_Scorecards.csv"
-                elif month_key == "November_2025":
-                    # Check for legacy file format first - try file (8) first, then (5), then new format
-                    legacy_path_8 = Path("Scorecards/Scorecard Review Executive Summary(Sheet1) (8).csv")
-                    legacy_path_5 = Path("Scorecards/Scorecard Review Executive Summary(Sheet1) (5).csv")
-                    if legacy_path_8.exists():
-                        csv_path = legacy_path_8
-                    elif legacy_path_5.exists():
-                        csv_path = legacy_path_5
-                    else:
-                        csv_path = scorecards_dir / f"{month_key}_Scorecards.csv"
-                else:
-                    csv_path = scorecards_dir / f"{month_key}_Scorecards.csv"
-            else:
-                # Fallback to current file format - try file (17) first, then (16), (15), (14), (13), (12), (11), (10), (8), (5)
-                legacy_path_17 = Path("Scorecards/Scorecard Review Executive Summary(Sheet1) (17).csv")
-                legacy_path_16 = Path("Scorecards/Scorecard Review Executive Summary(Sheet1) (16).csv")
-                legacy_path_15 = Path("Scorecards/Scorecard Review Executive Summary(Sheet1) (15).csv")
-                legacy_path_14 = Path("Scorecards/Scorecard Review Executive Summary(Sheet1) (14).csv")
-                legacy_path_13 = Path("Scorecards/Scorecard Review Executive Summary(Sheet1) (13).csv")
-                legacy_path_12 = Path("Scorecards/Scorecard Review Executive Summary(Sheet1) (12).csv")
-                legacy_path_11 = Path("Scorecards/Scorecard Review Executive Summary(Sheet1) (11).csv")
-                legacy_path_10 = Path("Scorecards/Scorecard Review Executive Summary(Sheet1) (10).csv")
-                legacy_path_8 = Path("Scorecards/Scorecard Review Executive Summary(Sheet1) (8).csv")
-                legacy_path_5 = Path("Scorecards/Scorecard Review Executive Summary(Sheet1) (5).csv")
-                if legacy_path_17.exists():
-                    csv_path = legacy_path_17
-                elif legacy_path_16.exists():
-                    csv_path = legacy_path_16
-                elif legacy_path_15.exists():
-                    csv_path = legacy_path_15
-                elif legacy_path_14.exists():
-                    csv_path = legacy_path_14
-                elif legacy_path_13.exists():
-                    csv_path = legacy_path_13
-                elif legacy_path_12.exists():
-                    csv_path = legacy_path_12
-                elif legacy_path_11.exists():
-                    csv_path = legacy_path_11
-                elif legacy_path_10.exists():
-                    csv_path = legacy_path_10
-                elif legacy_path_8.exists():
-                    csv_path = legacy_path_8
-                else:
-                    csv_path = legacy_path_5
-    
-    if not csv_path.exists():
+        available_months = get_available_months()
+        if not available_months:
+            # Fallback to current file format - try file (17) first, then (16), ..., (10), (8), (5)
+            for name in _NEW_FORMAT_LEGACY_FILES + LEGACY_CSV_FILES["November_2025"][:1]:
+                if (scorecards_dir / name).exists():
+                    return scorecards_dir / name
+            return scorecards_dir / LEGACY_CSV_FILES["November_2025"][-1]
+        month = available_months[0]
+    
+    # Check for legacy file format first, then new format
+    for name in LEGACY_CSV_FILES.get(month, ()):
+        if (scorecards_dir / name).exists():
+            return scorecards_dir / name
+    return scorecards_dir / f"{month}_Scorecards.csv"
+
+# For February/March 2026, supplemental CSVs are merged in: (1-59) life science and "2(Sheet1)"
+SUPPLEMENTAL_CSV_FILES = {
+    "February_2026": (
+        "Scorecard Review Executive Summary(1-59).csv",
+        "Scorecard Review Executive Summary 2(Sheet1) (4).csv",
+    ),
+}
+
+def _file_signature(path):
+    """(mtime, size) of a file, or None if it doesn't exist - keys caches to actual file changes"""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+# Cached month data is the output of this file's parsing code (process_data, parse_score, parse_dates,
+# clean_text_columns, COLUMN_MAP) and of mappings.py, so both files' bytes are hashed into its cache key:
+# editing either rebuilds the Parquet copies instead of serving the old code's output after a restart.
+# Bump CACHE_VERSION to force a rebuild without a code change (e.g. after upgrading pandas)
+CACHE_VERSION = 1
+CACHE_SOURCE_FILES = (Path(__file__), Path(__file__).with_name("mappings.py"))
+DATA_VERSION = f"v{CACHE_VERSION}-" + hashlib.sha1(b"".join(path.read_bytes() for path in CACHE_SOURCE_FILES)).hexdigest()[:16]
+
+def _source_files(month):
+    """CSV path for a month and its cache key: the signatures of every file its data is built from, then the data version"""
+    csv_path = _resolve_csv_path(month, _scorecards_dir_mtime())
+    source_files = (csv_path,) + tuple(Path("Scorecards") / name for name in SUPPLEMENTAL_CSV_FILES.get(month, ()))
+    return csv_path, tuple(_file_signature(path) for path in source_files) + (DATA_VERSION,)
+
+def _load_csv(month, csv_path, file_signatures):
+    """Load the month's CSV plus its supplemental CSVs; only called when the processed cache misses"""
+    csv_path = Path(csv_path)
+    if file_signatures[0] is None:
         # Return None if file doesn't exist (for blank state)
         return None
     
-    # Try multiple encodings to handle special characters
-    encodings = ['utf-8', 'latin-1', 'iso-8859-1', 'cp1252', 'windows-1252']
-    
-    for encoding in encodings:
-        try:
-            df = pd.read_csv(csv_path, encoding=encoding)
-            
-            # Clean all text columns to fix encoding issues
-            for col in df.columns:
-                if df[col].dtype == 'object':  # String columns
-                    df[col] = df[col].apply(clean_text)
-            
-            # For February/March 2026, merge supplemental CSVs: (1-59) life science and "2(Sheet1)" - filter by conduct month
-            if month == "February_2026":
-                scorecards_dir = Path("Scorecards")
-                for supplemental_path in [
-                    scorecards_dir / "Scorecard Review Executive Summary(1-59).csv",
-                    scorecards_dir / "Scorecard Review Executive Summary 2(Sheet1) (4).csv",
-                ]:
-                    df_sup = _load_and_normalize_supplemental_csv(supplemental_path, month, df.columns)
-                    if df_sup is not None and len(df_sup) > 0:
-                        df = pd.concat([df, df_sup], ignore_index=True)
-            
-            return df
-        except UnicodeDecodeError:
-            continue
-        except Exception as e:
-            st.error(f"Error loading CSV: {e}")
-            return None
-    
-    st.error(f"Could not read CSV with any standard encoding. Please check the file.")
-    return None
+    try:
+        # Detect the encoding once to handle special characters
+        df = read_scorecard_csv(csv_path)
+        
+        # Clean all text columns to fix encoding issues
+        df = clean_text_columns(df)
+        
+        # For February/March 2026, merge supplemental CSVs: (1-59) life science and "2(Sheet1)" - filter by conduct month
+        for name in SUPPLEMENTAL_CSV_FILES.get(month, ()):
+            df_sup = _load_and_normalize_supplemental_csv(Path("Scorecards") / name, month, df.columns)
+            if df_sup is not None and len(df_sup) > 0:
+                df = pd.concat([df, df_sup], ignore_index=True)
+        
+        return df
+    except UnicodeDecodeError as e:
+        st.error(f"Could not decode CSV as {e.encoding} (the encoding detected from its contents). Please re-export it as UTF-8.")
+        return None
+    except Exception as e:
+        st.error(f"Error loading CSV: {e}")
+        return None
+
+def normalize_account_names(names):
+    """Normalize a Series of account names using the fuzzy matching dictionaries"""
+    # The same few spellings repeat across every response: normalize each distinct one once
+    unique_names = names.dropna().unique()
+    return names.map({name: resolve_account(str(name)) for name in unique_names})
 
-def normalize_account_name(account_name):
-    """Normalize account name using fuzzy matching dictionary"""
-    if pd.isna(account_name):
+# Score text patterns for parse_score, compiled once
+_SCORE_PATTERNS = (
+    re.compile(r'SBM\s+(\d+\.?\d*)'),  # "SBM 4.25" or "SBM - 5."
+    re.compile(r'scored?\s+(?:a\s+)?(\d+\.?\d*)'),  # "scored a 5" or "score 4.5"
+    re.compile(r'(\d+\.?\d*)\s+out\s+of'),  # "5 out of 5"
+    re.compile(r'score[d]?\s+(?:of\s+)?(\d+\.?\d*)'),  # "score of 5"
+    re.compile(r'(\d+\.?\d*)/5'),  # "5/5"
+    re.compile(r'all\s+(?:sites?\s+)?(?:scored?\s+)?(?:a\s+)?(\d+\.?\d*)'),  # "all sites scored a 5"
+)
+_NUM_RE = re.compile(r'(\d+\.?\d*)')
+
+def parse_score(score_str):
+    """Parse the score column - handle various formats"""
+    if pd.isna(score_str):
         return None
     
-    account_str = str(account_name).strip()
+    score_str = str(score_str).strip()
     
-    # Check if it should be omitted
-    if account_str in account_name_variations and account_name_variations[account_str] is None:
+    # Handle N/A
+    if score_str.upper() == 'N/A':
         return None
     
-    # Check variations dictionary
-    if account_str in account_name_variations:
-        return account_name_variations[account_str]
+    # Handle formats like "4.68", "5", "4.0"
+    try:
+        return float(score_str)
+    except ValueError:
+        pass
     
-    # Check if exact match exists in account_to_vertical
-    if account_str in account_to_vertical:
-        return account_str
+    # Handle formats like "4.93/5.00" or "3.93/5.00"
+    if '/' in score_str:
+        try:
+            numerator = float(score_str.split('/')[0])
+            return numerator
+        except ValueError:
+            pass
     
-    # Case-insensitive check in account_to_vertical
-    for key in account_to_vertical.keys():
-        if key.lower() == account_str.lower():
-            return key
+    # Extract score from text like "Every site scored a 5 this month"
+    score_lower = score_str.lower()
+    for pattern in _SCORE_PATTERNS:
+        match = pattern.search(score_lower)
+        if match:
+            try:
+                score = float(match.group(1))
+                # Validate score is reasonable (0-5 range)
+                if 0 <= score <= 5:
+                    return score
+            except ValueError:
+                pass
     
-    # If no match found, return original (will be filtered out later)
-    return account_str
+    # Extract multiple scores and average them (e.g., "Bloomfield – 4.0 St. Louis – 5.0")
+    numbers = _NUM_RE.findall(score_str)
+    if numbers:
+        try:
+            # Convert to floats and filter to valid score range (0-5)
+            valid_scores = [float(n) for n in numbers if 0 <= float(n) <= 5]
+            if valid_scores:
+                return sum(valid_scores) / len(valid_scores)  # Return average
+        except ValueError:
+            pass
+    
+    return None
+
+# Original form column, its new-format twin (suffixed "1") and the unified display column built from them
+# (Score_Raw rather than Score to avoid clobbering the parsed score)
+COLUMN_MAP = (
+    ('Name of Account/Portfolio', 'Name of Account/Portfolio1', 'Name of Account/Portfolio'),
+    ('Date/Time of Scorecard Review?', 'Date/Time of Scorecard Review?1', 'Review Date'),
+    ('Who attended your Scorecard Review?\nNames and titles of all external and internal attendees.', 'Who attended your Scorecard Review?\nNames and titles of all external and internal attendees.1', 'Attendees'),
+    ('What was the overall Scorecard Score?', 'What was the overall Scorecard Score?1', 'Score_Raw'),
+    ('Summary of Review\nWhat did you cover during the review? Please provide a brief summary of what was covered.\n\n', 'Summary of Review\nWhat did you cover during the review? Please provide a brief summary of what was covered.\n\n1', 'Summary'),
+    ('Customer Feedback\n\nWhat was the feedback from the client -- include any concerns and compliments shared and who shared it.\n', 'Customer Feedback\n\nWhat was the feedback from the client -- include any concerns and compliments shared and who shared it.\n1', 'Customer Feedback'),
+    ('Action Items/Follow Ups\n\nWhat action items/follow ups came out of the meeting? Who owns them and agreed upon timelines?\n', 'Action Items/Follow Ups\n\nWhat action items/follow ups came out of the meeting? Who owns them and agreed upon timelines?\n1', 'Action Items'),
+    ('Date of Next Scorecard Review', 'Date of Next Scorecard Review1', 'Next Review Date'),
+)
 
-@st.cache_data(ttl=60)  # Cache for 60 seconds only
 def process_data(df, month=None):
     """Process and enrich data with verticals - handles both original and new column sets"""
     if df is None or len(df) == 0:
@@ -403,7 +402,7 @@ def process_data(df, month=None):
     # Filter by conduct month (Start time): Feb/Mar use conduct month (reviews in March = February scorecards), else label month
     if (month in MONTH_TO_YEAR_MONTH or month in CONDUCT_MONTH_FOR_LABEL) and 'Start time' in df.columns:
         year, target_month = CONDUCT_MONTH_FOR_LABEL.get(month) or MONTH_TO_YEAR_MONTH[month]
-        start_series = pd.to_datetime(df['Start time'], errors='coerce')
+        start_series = parse_dates(df['Start time'])
         mask = start_series.notna() & (start_series.dt.year == year) & (start_series.dt.month == target_month)
         df = df[mask].copy()
         if len(df) == 0:
@@ -422,197 +421,143 @@ def process_data(df, month=None):
     # For other months, detect based on which column has data
     is_december = (month == "December_2025")  # kept for any December-only logic; use is_new_format_month for shared behavior
     
-    def get_account_name(row):
-        # For new-format months (Dec 2025, Jan/Feb 2026), always use new column
-        if is_new_format_month:
-            return row.get(new_account_col)
-        # For other months, check which column has data
-        if pd.notna(row.get(new_account_col)) and str(row.get(new_account_col)).strip():
-            return row.get(new_account_col)
-        # Otherwise use original column
-        return row.get(original_account_col)
-    
-    def get_column_value(row, original_col, new_col):
-        """Get value from appropriate column set"""
-        # For new-format months, always use new column set
-        if is_new_format_month:
-            if new_col in df.columns:
-                return row.get(new_col)
-            return None
-        # For other months, detect based on which column has data
-        new_account_val = row.get(new_account_col)
-        if pd.notna(new_account_val) and str(new_account_val).strip():
-            # Use new column set
-            if new_col in df.columns:
-                return row.get(new_col)
-        # Use original column set
-        if original_col in df.columns:
-            return row.get(original_col)
-        return None
+    # For new-format months (Dec 2025, Jan/Feb 2026), always use new columns;
+    # for other months, rows whose new account column has data use the new column set
+    if is_new_format_month:
+        use_new = pd.Series(True, index=df.index)
+    elif new_account_col in df.columns:
+        new_account_vals = df[new_account_col]
+        use_new = new_account_vals.notna() & new_account_vals.astype(str).str.strip().ne('')
+    else:
+        use_new = pd.Series(False, index=df.index)
+    
+    def get_column_values(original_col, new_col):
+        """Get values from appropriate column set for every row"""
+        missing = pd.Series(None, index=df.index, dtype=object)
+        original_vals = df[original_col] if original_col in df.columns else missing
+        if new_col not in df.columns:
+            return missing if is_new_format_month else original_vals
+        return df[new_col].where(use_new, original_vals)
     
     # Create unified columns
-    df['Account_Name'] = df.apply(get_account_name, axis=1)
+    df['Account_Name'] = get_column_values(original_account_col, new_account_col)
     
     # Normalize account names
-    df['Account_Normalized'] = df['Account_Name'].apply(normalize_account_name)
+    df['Account_Normalized'] = normalize_account_names(df['Account_Name'])
     
     # Filter out None values (omitted accounts)
     df = df[df['Account_Normalized'].notna()].copy()
+    use_new = use_new.loc[df.index]
     
     # Extract IFM field (file 13 uses "Who is Your IFM", older files use "Who is Your FM")
     ifm_col = 'Who is Your IFM' if 'Who is Your IFM' in df.columns else 'Who is Your FM'
     if ifm_col in df.columns:
-        df['IFM'] = df[ifm_col].fillna('')
-        df['IFM'] = df['IFM'].apply(lambda x: str(x).strip() if pd.notna(x) else '')
+        df['IFM'] = df[ifm_col].fillna('').astype(str).str.strip()
     else:
         df['IFM'] = ''
     
     # Create composite account identifier that includes IFM for December entries
     # This allows separate scorecards for same account with different IFM types (e.g., Merck Sodexo vs Merck Direct)
-    def create_account_identifier(row):
-        base_account = row['Account_Normalized']
-        ifm = row.get('IFM', '')
-        
-        # For new-format months or when IFM is present, append IFM to create unique identifier
-        if is_new_format_month and ifm and ifm != '':
-            # Clean up IFM value for display
-            ifm_clean = ifm.replace('(None)', '').strip()
-            if ifm_clean:
-                return f"{base_account} ({ifm_clean})"
-        
-        return base_account
-    
-    df['Account_Identifier'] = df.apply(create_account_identifier, axis=1)
+    df['Account_Identifier'] = df['Account_Normalized']
+    if is_new_format_month:
+        # Clean up IFM value for display and append it to create unique identifier
+        ifm_clean = df['IFM'].str.replace('(None)', '', regex=False).str.strip()
+        has_ifm = ifm_clean.ne('')
+        df.loc[has_ifm, 'Account_Identifier'] = df['Account_Normalized'] + ' (' + ifm_clean + ')'
     
     # Add vertical based on normalized account name (not the composite identifier)
     # This ensures vertical assignment is based on the base account name
     df['Vertical'] = df['Account_Normalized'].map(account_to_vertical)
     df['Vertical'] = df['Vertical'].fillna('Other')  # Assign "Other" to unmapped accounts
     
-    # Parse the score column - handle various formats
-    def parse_score(score_str):
-        if pd.isna(score_str):
-            return None
-        
-        score_str = str(score_str).strip()
-        
-        # Handle N/A
-        if score_str.upper() == 'N/A':
-            return None
-        
-        # Handle formats like "4.68", "5", "4.0"
-        try:
-            return float(score_str)
-        except:
-            pass
-        
-        # Handle formats like "4.93/5.00" or "3.93/5.00"
-        if '/' in score_str:
-            try:
-                numerator = float(score_str.split('/')[0])
-                return numerator
-            except:
-                pass
-        
-        # Extract score from text like "Every site scored a 5 this month"
-        score_patterns = [
-            r'SBM\s+(\d+\.?\d*)',                # "SBM 4.25" or "SBM - 5."
-            r'scored?\s+(?:a\s+)?(\d+\.?\d*)',  # "scored a 5" or "score 4.5"
-            r'(\d+\.?\d*)\s+out\s+of',          # "5 out of 5"
-            r'score[d]?\s+(?:of\s+)?(\d+\.?\d*)', # "score of 5"
-            r'(\d+\.?\d*)/5',                    # "5/5"
-            r'all\s+(?:sites?\s+)?(?:scored?\s+)?(?:a\s+)?(\d+\.?\d*)', # "all sites scored a 5"
-        ]
-        
-        for pattern in score_patterns:
-            match = re.search(pattern, score_str.lower())
-            if match:
-                try:
-                    score = float(match.group(1))
-                    # Validate score is reasonable (0-5 range)
-                    if 0 <= score <= 5:
-                        return score
-                except:
-                    pass
-        
-        # Extract multiple scores and average them (e.g., "Bloomfield – 4.0 St. Louis – 5.0")
-        numbers = re.findall(r'(\d+\.?\d*)', score_str)
-        if numbers:
-            try:
-                # Convert to floats and filter to valid score range (0-5)
-                valid_scores = [float(n) for n in numbers if 0 <= float(n) <= 5]
-                if valid_scores:
-                    return sum(valid_scores) / len(valid_scores)  # Return average
-            except:
-                pass
-        
-        return None
+    # Few distinct values repeated across rows: store as categories so grouping/filtering compares int codes
+    df['Vertical'] = df['Vertical'].astype('category')
+    df['Account_Normalized'] = df['Account_Normalized'].astype('category')
     
     # Get score from appropriate column
     original_score_col = 'What was the overall Scorecard Score?'
     new_score_col = 'What was the overall Scorecard Score?1'
-    df['Score_Raw'] = df.apply(lambda row: get_column_value(row, original_score_col, new_score_col), axis=1)
-    df['Score'] = df['Score_Raw'].apply(parse_score)
+    df['Score_Raw'] = get_column_values(original_score_col, new_score_col)
+    # Most scores are plain numbers: convert them in one pass, then "4.93/5.00" numerators in another,
+    # and only parse the remaining free text row by row
+    score = pd.to_numeric(df['Score_Raw'], errors='coerce').astype(float)
+    needs_parsing = score.isna() & df['Score_Raw'].notna()
+    raw_text = df.loc[needs_parsing, 'Score_Raw'].astype(str).str.strip()
+    fractions = raw_text[raw_text.str.contains('/', regex=False)]
+    score.loc[fractions.index] = pd.to_numeric(fractions.str.split('/', n=1).str[0], errors='coerce')
+    needs_parsing &= score.isna()
+    score_texts = df.loc[needs_parsing, 'Score_Raw']
+    score[needs_parsing] = score_texts.map({text: parse_score(text) for text in score_texts.unique()})  # Each distinct text once
+    df['Score'] = score
     
     # Get date from appropriate column
     original_date_col = 'Date/Time of Scorecard Review?'
     new_date_col = 'Date/Time of Scorecard Review?1'
-    df['Review_Date'] = pd.to_datetime(
-        df.apply(lambda row: get_column_value(row, original_date_col, new_date_col), axis=1),
-        errors='coerce'
-    )
-    df['Completion_Date'] = pd.to_datetime(df['Completion time'], errors='coerce')
+    df['Review_Date'] = parse_dates(get_column_values(original_date_col, new_date_col))
+    df['Completion_Date'] = parse_dates(df['Completion time'])
     
     # Store all CSV fields for detail view - create unified columns for display
-    def get_unified_column(row, original_col, new_col, default=''):
-        """Get value from appropriate column set with fallback"""
-        val = get_column_value(row, original_col, new_col)
-        if pd.isna(val) or str(val).strip() == '':
-            return default
-        return str(val).strip()
-    
-    # Map original column names to new column names
-    column_mapping = {
-        'Name of Account/Portfolio': 'Name of Account/Portfolio1',
-        'Date/Time of Scorecard Review?': 'Date/Time of Scorecard Review?1',
-        'Who attended your Scorecard Review?\nNames and titles of all external and internal attendees.': 'Who attended your Scorecard Review?\nNames and titles of all external and internal attendees.1',
-        'What was the overall Scorecard Score?': 'What was the overall Scorecard Score?1',
-        'Summary of Review\nWhat did you cover during the review? Please provide a brief summary of what was covered.\n\n': 'Summary of Review\nWhat did you cover during the review? Please provide a brief summary of what was covered.\n\n1',
-        'Customer Feedback\n\nWhat was the feedback from the client -- include any concerns and compliments shared and who shared it.\n': 'Customer Feedback\n\nWhat was the feedback from the client -- include any concerns and compliments shared and who shared it.\n1',
-        'Action Items/Follow Ups\n\nWhat action items/follow ups came out of the meeting? Who owns them and agreed upon timelines?\n': 'Action Items/Follow Ups\n\nWhat action items/follow ups came out of the meeting? Who owns them and agreed upon timelines?\n1',
-        'Date of Next Scorecard Review': 'Date of Next Scorecard Review1'
-    }
+    def get_unified_column(original_col, new_col, default=''):
+        """Get stripped string values from appropriate column set with fallback"""
+        vals = get_column_values(original_col, new_col)
+        stripped = vals.astype(str).str.strip()
+        return stripped.where(vals.notna() & stripped.ne(''), default)
     
     # Create unified columns for all fields
-    for orig_col, new_col in column_mapping.items():
-        unified_name = orig_col.replace('\n', ' ').replace('?', '').replace(':', '').strip()
-        if unified_name.startswith('Summary'):
-            unified_name = 'Summary'
-        elif unified_name.startswith('Customer Feedback'):
-            unified_name = 'Customer Feedback'
-        elif unified_name.startswith('Action Items'):
-            unified_name = 'Action Items'
-        elif unified_name.startswith('Who attended'):
-            unified_name = 'Attendees'
-        elif unified_name.startswith('Date of Next'):
-            unified_name = 'Next Review Date'
-        elif unified_name.startswith('Date/Time'):
-            unified_name = 'Review Date'
-        elif unified_name.startswith('What was the overall'):
-            unified_name = 'Score_Raw'  # Use Score_Raw to avoid conflict with parsed Score column
-        
+    for orig_col, new_col, unified_name in COLUMN_MAP:
         # Only create unified column if it doesn't already exist or if it's a different column
         if unified_name not in df.columns or unified_name == 'Score_Raw':
-            df[unified_name] = df.apply(
-                lambda row: get_unified_column(row, orig_col, new_col),
-                axis=1
-            )
-    
-    # Also store raw CSV row data for detail view
-    df['_raw_row_data'] = df.apply(lambda row: row.to_dict(), axis=1)
+            df[unified_name] = get_unified_column(orig_col, new_col)
     
     return df
 
+# Processed frames are persisted here so a cold start (new worker, restart) skips parsing and processing
+PROCESSED_CACHE_DIR = Path("Scorecards") / ".cache"
+PROCESSED_CACHE_MAX_FILES = 8  # Least recently used month files beyond this are evicted
+
+def _missing_as_nan(df):
+    """Missing values in text columns as NaN on both load paths: a fresh parse mixes NaN and None
+    while Parquet reads every one back as None, and the UI shows the two differently ('nan' vs 'None')"""
+    text_cols = df.columns[df.dtypes == object]
+    df[text_cols] = df[text_cols].where(df[text_cols].notna(), np.nan)
+    return df
+
+def _load_processed(month, csv_path, file_signatures):
+    """Processed data from the on-disk Parquet copy if the source files are unchanged, else built and saved.
+    Not memoized itself: _load_month_accounts holds the result in memory"""
+    if file_signatures[0] is None:
+        return None
+    prefix = f"{month or 'latest'}_"
+    cache_path = PROCESSED_CACHE_DIR / f"{prefix}{hashlib.sha1(repr(file_signatures).encode()).hexdigest()[:16]}.parquet"
+    if cache_path.exists():
+        try:
+            processed_df = pd.read_parquet(cache_path)
+            cache_path.touch()  # Mark as recently used for eviction
+            return _missing_as_nan(processed_df)
+        except Exception:
+            pass  # Unreadable cache file - rebuild it below
+    
+    raw_df = _load_csv(month, csv_path, file_signatures)
+    if raw_df is None:
+        return None
+    processed_df = _missing_as_nan(process_data(raw_df, month=month))
+    
+    # Best effort: a read-only disk or a column Parquet can't store just means no disk cache
+    try:
+        PROCESSED_CACHE_DIR.mkdir(exist_ok=True)
+        for stale in PROCESSED_CACHE_DIR.glob(f"{prefix}*.parquet"):
+            stale.unlink()
+        processed_df.to_parquet(cache_path, compression='zstd')
+        cached = sorted(PROCESSED_CACHE_DIR.glob("*.parquet"), key=lambda path: path.stat().st_mtime_ns, reverse=True)
+        for old_file in cached[PROCESSED_CACHE_MAX_FILES:]:
+            old_file.unlink()
+    except Exception:
+        pass
+    return processed_df
+
+# A score field listing several sites, e.g. "Site A – 4, Site B – 5": a dash and a digit anywhere
+_MULTI_SITE_RE = re.compile(r'[–—].*\d|\d.*[–—]', re.DOTALL)
+
 def build_summary_with_sites(account, latest_row, account_df):
     """Build summary with site-specific scores if multiple locations"""
     base_summary = latest_row.get('Summary', 'N/A')
@@ -621,7 +566,7 @@ def build_summary_with_sites(account, latest_row, account_df):
     score_field = str(latest_row.get('Score_Raw', ''))
     
     # If multiple scores detected in the score field, add breakdown at the top
-    if ('–' in score_field or '—' in score_field) and any(char.isdigit() for char in score_field):
+    if _MULTI_SITE_RE.search(score_field):
         site_breakdown = f"**Site Scores:** {score_field}\n\n---\n\n"
         return site_breakdown + str(base_summary)
     
@@ -635,20 +580,19 @@ def merge_multiple_reviews(account_df, account_name):
     # Sort by completion date (most recent first)
     account_df = account_df.sort_values('Completion_Date', ascending=False)
     
+    # Pull the few columns needed as plain lists rather than building a Series per row
+    def column(name, default='N/A'):
+        return account_df[name].tolist() if name in account_df.columns else [default] * len(account_df)
+    
     # Get all entries
     entries = []
     scores = []
-    for idx, row in account_df.iterrows():
-        original_name = row.get('Account_Name', account_name)
-        score = row.get('Score')
+    for original_name, score, date, summary, feedback, action_items in zip(
+            column('Account_Name', account_name), column('Score', None), column('Review_Date'),
+            column('Summary'), column('Customer Feedback'), column('Action Items')):
         if pd.notna(score):
             scores.append(float(score))
         
-        summary = row.get('Summary', 'N/A')
-        feedback = row.get('Customer Feedback', 'N/A')
-        action_items = row.get('Action Items', 'N/A')
-        date = row.get('Review_Date', 'N/A')
-        
         entries.append({
             'name': original_name,
             'score': score,
@@ -658,22 +602,6 @@ def merge_multiple_reviews(account_df, account_name):
             'action_items': action_items
         })
     
-    # Build merged summary
-    merged_summary = f"**{len(entries)} Reviews Combined:**\n\n"
-    for i, entry in enumerate(entries, 1):
-        score_str = f"Score: {entry['score']}" if pd.notna(entry['score']) else "Score: N/A"
-        merged_summary += f"**{i}. {entry['name']}** ({entry['date']}) - {score_str}\n\n{entry['summary']}\n\n---\n\n"
-    
-    # Build merged feedback
-    merged_feedback = f"**Feedback from {len(entries)} Reviews:**\n\n"
-    for i, entry in enumerate(entries, 1):
-        merged_feedback += f"**{entry['name']}:**\n{entry['feedback']}\n\n---\n\n"
-    
-    # Build merged action items
-    merged_action_items = f"**Action Items from {len(entries)} Reviews:**\n\n"
-    for i, entry in enumerate(entries, 1):
-        merged_action_items += f"**{entry['name']}:**\n{entry['action_items']}\n\n---\n\n"
-    
     # Calculate average score
     avg_score = sum(scores) / len(scores) if scores else None
     
@@ -682,20 +610,56 @@ def merge_multiple_reviews(account_df, account_name):
     latest_completion = account_df['Completion_Date'].max()
     
     return {
-        'summary': merged_summary.strip(),
-        'feedback': merged_feedback.strip(),
-        'action_items': merged_action_items.strip(),
+        'summary': render_merged_text(entries, 'summary'),
+        'feedback': render_merged_text(entries, 'feedback'),
+        'action_items': render_merged_text(entries, 'action_items'),
         'score': avg_score,
         'date': latest_date,
         'completion_date': latest_completion
     }
 
+def render_merged_text(entries, field):
+    """Build the combined markdown for one detail field of a merged account"""
+    if field == 'summary':
+        text = f"**{len(entries)} Reviews Combined:**\n\n"
+        for i, entry in enumerate(entries, 1):
+            score_str = f"Score: {entry['score']}" if pd.notna(entry['score']) else "Score: N/A"
+            text += f"**{i}. {entry['name']}** ({entry['date']}) - {score_str}\n\n{entry['summary']}\n\n---\n\n"
+    elif field == 'feedback':
+        text = f"**Feedback from {len(entries)} Reviews:**\n\n"
+        for entry in entries:
+            text += f"**{entry['name']}:**\n{entry['feedback']}\n\n---\n\n"
+    else:
+        text = f"**Action Items from {len(entries)} Reviews:**\n\n"
+        for entry in entries:
+            text += f"**{entry['name']}:**\n{entry['action_items']}\n\n---\n\n"
+    return text.strip()
+
+# Characters of each long text field shown in a collapsed data-view entry until the full text is asked for
+DETAIL_PREVIEW_CHARS = 300
+
+def text_preview(text, limit=DETAIL_PREVIEW_CHARS):
+    """Shorten long text to about `limit` characters, cut at a word boundary"""
+    if not isinstance(text, str) or len(text) <= limit:
+        return text
+    return text[:limit].rsplit(' ', 1)[0] + ' …'
+
+# Accounts that should merge multiple reviews
+MERGE_REVIEW_ACCOUNTS = frozenset({"Gilead Sciences", "Nike", "General Motors"})
+
 def get_all_accounts_with_data(processed_df):
     """Get dictionary of all accounts with their data"""
     accounts_data = {}
     
-    # Accounts that should merge multiple reviews
-    merge_accounts = ["Gilead Sciences", "Nike", "General Motors"]
+    # Partition the data by account once instead of scanning the whole frame per account (groups keep CSV order).
+    # One newest-first stable sort also gives each entry's latest row: the first with the max completion date, as idxmax would pick
+    account_groups = {}
+    latest_labels = {}
+    if len(processed_df) > 0:
+        account_groups = dict(list(processed_df.groupby('Account_Normalized', sort=False, observed=True)))
+        entry_col = 'Account_Identifier' if 'Account_Identifier' in processed_df.columns else 'Account_Normalized'
+        latest_rows = processed_df.sort_values('Completion_Date', ascending=False, kind='stable').drop_duplicates(entry_col)
+        latest_labels = dict(zip(latest_rows[entry_col], latest_rows.index))
     
     for account, vertical in account_to_vertical.items():
         if len(processed_df) == 0:
@@ -714,18 +678,17 @@ def get_all_accounts_with_data(processed_df):
         # If so, get all entries for this base account (including all IFM variations)
         if 'Account_Identifier' in processed_df.columns:
             # Get all entries where the base account matches (could be multiple IFM variations)
-            account_df = processed_df[processed_df['Account_Normalized'] == account]
+            account_df = account_groups.get(account)
             
-            if len(account_df) > 0:
+            if account_df is not None:
                 # Group by Account_Identifier to create separate entries per IFM type
-                for account_id in account_df['Account_Identifier'].unique():
-                    id_df = account_df[account_df['Account_Identifier'] == account_id]
+                for account_id, id_df in account_df.groupby('Account_Identifier', sort=False):
                     
                     # Use the composite identifier as the key
                     display_account = account_id if account_id != account else account
                     
                     # Check if this account should merge multiple reviews
-                    if account in merge_accounts and len(id_df) > 1:
+                    if account in MERGE_REVIEW_ACCOUNTS and len(id_df) > 1:
                         merged = merge_multiple_reviews(id_df, display_account)
                         if merged:
                             accounts_data[display_account] = {
@@ -741,13 +704,12 @@ def get_all_accounts_with_data(processed_df):
                                 'action_items': merged['action_items'],
                                 'attendees': id_df.iloc[0].get('Attendees', 'N/A'),
                                 'ifm': id_df.iloc[0].get('IFM', ''),
-                                'raw_data': id_df.iloc[0].get('_raw_row_data', {})
+                                'raw_data': id_df.iloc[0].to_dict()
                             }
                             continue
                     
                     # Standard processing for single review or accounts not in merge list
-                    latest_idx = id_df['Completion_Date'].idxmax()
-                    latest = id_df.loc[latest_idx]
+                    latest = processed_df.loc[latest_labels[account_id]]
                     
                     accounts_data[display_account] = {
                         'vertical': vertical,
@@ -762,7 +724,7 @@ def get_all_accounts_with_data(processed_df):
                         'action_items': latest.get('Action Items', 'N/A'),
                         'attendees': latest.get('Attendees', 'N/A'),
                         'ifm': latest.get('IFM', ''),
-                        'raw_data': latest.get('_raw_row_data', {})
+                        'raw_data': latest.to_dict()
                     }
             else:
                 # No data for this account
@@ -776,11 +738,11 @@ def get_all_accounts_with_data(processed_df):
                 }
         else:
             # Original logic for non-December entries
-            account_df = processed_df[processed_df['Account_Normalized'] == account]
+            account_df = account_groups.get(account)
             
-            if len(account_df) > 0:
+            if account_df is not None:
                 # Check if this account should merge multiple reviews
-                if account in merge_accounts and len(account_df) > 1:
+                if account in MERGE_REVIEW_ACCOUNTS and len(account_df) > 1:
                     merged = merge_multiple_reviews(account_df, account)
                     if merged:
                         accounts_data[account] = {
@@ -796,13 +758,12 @@ def get_all_accounts_with_data(processed_df):
                             'action_items': merged['action_items'],
                             'attendees': account_df.iloc[0].get('Attendees', 'N/A'),
                             'ifm': account_df.iloc[0].get('IFM', ''),
-                            'raw_data': account_df.iloc[0].get('_raw_row_data', {})
+                            'raw_data': account_df.iloc[0].to_dict()
                         }
                         continue
                 
                 # Standard processing for single review or accounts not in merge list
-                latest_idx = account_df['Completion_Date'].idxmax()
-                latest = account_df.loc[latest_idx]
+                latest = processed_df.loc[latest_labels[account]]
                 
                 accounts_data[account] = {
                     'vertical': vertical,
@@ -817,7 +778,7 @@ def get_all_accounts_with_data(processed_df):
                     'action_items': latest.get('Action Items', 'N/A'),
                     'attendees': latest.get('Attendees', 'N/A'),
                     'ifm': latest.get('IFM', ''),
-                    'raw_data': latest.get('_raw_row_data', {})
+                    'raw_data': latest.to_dict()
                 }
             else:
                 accounts_data[account] = {
@@ -836,10 +797,14 @@ def get_all_accounts_with_data(processed_df):
         if len(other_accounts_df) > 0:
             # Group by Account_Identifier to maintain separate entries for different IFM types
             identifier_col = 'Account_Identifier' if 'Account_Identifier' in other_accounts_df.columns else 'Account_Normalized'
-            for account_identifier in other_accounts_df[identifier_col].unique():
-                account_df = other_accounts_df[other_accounts_df[identifier_col] == account_identifier]
-                latest_idx = account_df['Completion_Date'].idxmax()
-                latest = account_df.loc[latest_idx]
+            # One pass: response counts per account (first-seen order) and each account's latest row,
+            # i.e. the first row with the max completion date, as idxmax would pick
+            response_counts = other_accounts_df.groupby(identifier_col, sort=False, observed=True).size()
+            latest_rows = (other_accounts_df.sort_values('Completion_Date', ascending=False, kind='stable')
+                           .drop_duplicates(identifier_col))
+            latest_by_account = dict(zip(latest_rows[identifier_col], latest_rows.to_dict('records')))
+            for account_identifier, response_count in response_counts.items():
+                latest = latest_by_account[account_identifier]
                 
                 accounts_data[account_identifier] = {
                     'vertical': 'Other',
@@ -847,41 +812,87 @@ def get_all_accounts_with_data(processed_df):
                     'score': latest['Score'],
                     'date': latest['Review_Date'],
                     'completion_date': latest['Completion_Date'],
-                    'response_count': len(account_df),
+                    'response_count': int(response_count),
                     'account_director': latest.get('Please Enter Your Name', 'N/A'),
                     'summary': latest.get('Summary', 'N/A'),
                     'feedback': latest.get('Customer Feedback', 'N/A'),
                     'action_items': latest.get('Action Items', 'N/A'),
                     'attendees': latest.get('Attendees', 'N/A'),
                     'ifm': latest.get('IFM', ''),
-                    'raw_data': latest.get('_raw_row_data', {})
+                    'raw_data': latest
                 }
     
     return accounts_data
 
+def build_accounts_frame(all_accounts):
+    """One row per account with the fields the filters, metrics and data table read.
+    Built once per month load; IFM values are already filled and stripped by process_data, so they compare with plain =="""
+    return pd.DataFrame.from_dict(
+        {k: {'vertical': v['vertical'], 'ifm': v.get('ifm', ''), 'score': v.get('score'), 'has_data': v['has_data'],
+             'response_count': v['response_count'], 'completion_date': v.get('completion_date'), 'date': v.get('date')}
+         for k, v in all_accounts.items()},
+        orient='index', columns=['vertical', 'ifm', 'score', 'has_data', 'response_count', 'completion_date', 'date'])
+
+def load_month_accounts(month=None):
+    """Processed data for a month and its accounts dict; (None, None) if the month has no data file"""
+    csv_path, file_signatures = _source_files(month)
+    return _load_month_accounts(month, str(csv_path), file_signatures)
+
+# cache_resource hands every session the same objects instead of unpickling a copy per call:
+# the processed frame and accounts dict are read-only once built, and nothing downstream mutates them
+@st.cache_resource(ttl=24 * 60 * 60, max_entries=12, show_spinner=False)  # One entry per month
+def _load_month_accounts(month, csv_path, file_signatures):
+    """Cached per month so filter changes and detail clicks don't rebuild the accounts dict on every rerun"""
+    processed_df = _load_processed(month, csv_path, file_signatures)
+    if processed_df is None:
+        return None, None
+    return processed_df, get_all_accounts_with_data(processed_df)
+
+def load_ifm_options(month=None):
+    """IFM filter options per vertical for a month ('All' = every vertical), each sorted"""
+    csv_path, file_signatures = _source_files(month)
+    return _load_ifm_options(month, str(csv_path), file_signatures)
+
+@st.cache_data(ttl=24 * 60 * 60, max_entries=12, show_spinner=False)
+def _load_ifm_options(month, csv_path, file_signatures):
+    """Built once per month so the sidebar doesn't rescan every account on each rerun"""
+    _, all_accounts = _load_month_accounts(month, csv_path, file_signatures)
+    ifm_by_vertical = {'All': set()}
+    for account_data in (all_accounts or {}).values():
+        ifm_val = account_data.get('ifm', '')  # Already filled and stripped by process_data
+        if ifm_val:
+            ifm_by_vertical.setdefault(account_data.get('vertical'), set()).add(ifm_val)
+            ifm_by_vertical['All'].add(ifm_val)
+    return {vertical: sorted(ifm_values) for vertical, ifm_values in ifm_by_vertical.items()}
+
+# Badge color per vertical
+VERTICAL_COLORS = {
+    'Aviation': '#FF6B6B',
+    'Automotive': '#4ECDC4',
+    'Manufacturing': '#45B7D1',
+    'Technology': '#96CEB4',
+    'Life Science': '#FFEAA7',
+    'Finance': '#DFE6E9',
+    'Distribution': '#A29BFE',
+    'R&D / Education / Other': '#FD79A8',
+    'Other': '#95A5A6'
+}
+
 def get_vertical_color(vertical):
     """Get color for vertical badge"""
-    colors = {
-        'Aviation': '#FF6B6B',
-        'Automotive': '#4ECDC4',
-        'Manufacturing': '#45B7D1',
-        'Technology': '#96CEB4',
-        'Life Science': '#FFEAA7',
-        'Finance': '#DFE6E9',
-        'Distribution': '#A29BFE',
-        'R&D / Education / Other': '#FD79A8',
-        'Other': '#95A5A6'
-    }
-    return colors.get(vertical, '#B2BEC3')
+    return VERTICAL_COLORS.get(vertical, '#B2BEC3')
+
+@lru_cache(maxsize=32)
+def vertical_badge_html(vertical):
+    """Vertical badge markup for account cards, built once per vertical"""
+    return f'<div class="vertical-badge" style="background-color: {get_vertical_color(vertical)};">{vertical}</div>'
 
 def render_december_detail_view(account, data):
     """Render detailed view for December account"""
     vertical_color = get_vertical_color(data['vertical'])
     
     # Back button
-    if st.button("← Back to Account Cards", key="back_to_cards"):
-        st.session_state['selected_account'] = None
-        st.rerun()
+    st.button("← Back to Account Cards", key="back_to_cards", on_click=_select_account, args=(None,))
     
     st.markdown("---")
     
@@ -968,19 +979,18 @@ def render_december_insights(processed_df, all_accounts, accounts_with_data, mon
     col1, col2, col3, col4 = st.columns(4)
     
     total_accounts_with_data = len(accounts_with_data)
+    # One pass over the accounts for all three statistics
     unique_ifms = set()
+    unique_verticals = set()
+    total_responses = 0
     for account_data in accounts_with_data.values():
         ifm = account_data.get('ifm', '')
         if ifm and str(ifm).strip():
             unique_ifms.add(str(ifm).strip())
-    
-    unique_verticals = set()
-    for account_data in accounts_with_data.values():
         vertical = account_data.get('vertical', '')
         if vertical:
             unique_verticals.add(vertical)
-    
-    total_responses = sum(v['response_count'] for v in accounts_with_data.values())
+        total_responses += account_data['response_count']
     
     with col1:
         st.metric("Accounts with Data", total_accounts_with_data)
@@ -1216,10 +1226,8 @@ def render_december_insights(processed_df, all_accounts, accounts_with_data, mon
     
     if "November_2025" in available_months:
         # Load November data for comparison
-        nov_raw_df = load_data(month="November_2025")
-        if nov_raw_df is not None:
-            nov_processed_df = process_data(nov_raw_df, month="November_2025")
-            nov_all_accounts = get_all_accounts_with_data(nov_processed_df)
+        nov_processed_df, nov_all_accounts = load_month_accounts(month="November_2025")
+        if nov_processed_df is not None:
             nov_accounts_with_data = {k: v for k, v in nov_all_accounts.items() if v['has_data']}
             
             # Compare metrics
@@ -1366,84 +1374,102 @@ def render_december_insights(processed_df, all_accounts, accounts_with_data, mon
         st.info("November 2025 data not available for comparison")
     
 
-def render_account_card(account, data, month=None):
-    """Render a single account card with clickable button"""
-    vertical_color = get_vertical_color(data['vertical'])
-    
-    if data['has_data']:
-        score = data['score']
-        if score is not None:
-            if score >= 4.5:
-                score_class = "score-high"
-            elif score >= 3.5:
-                score_class = "score-medium"
-            else:
-                score_class = "score-low"
-            score_display = f'<span class="{score_class}">{score:.2f}</span>'
-        else:
-            score_display = '<span style="color: #999;">N/A</span>'
-        
-        date_display = data['date'].strftime('%m/%d/%Y') if pd.notna(data['date']) else 'N/A'
-        
-        # For December, make the entire card clickable
-        if month in ("December_2025", "January_2026", "February_2026"):
-            # Display card with clickable button below it
-            st.markdown(f"""
-            <div class="account-card" style="cursor: pointer;">
-                <h3 style="margin: 0 0 10px 0; color: #1a1a1a;">{account}</h3>
-                <div class="vertical-badge" style="background-color: {vertical_color};">{data['vertical']}</div>
-                <div style="margin-top: 15px;">
-                    <div style="font-size: 14px; color: #666;">Latest Score</div>
-                    <div>{score_display}</div>
-                </div>
-                <div style="margin-top: 10px; font-size: 14px; color: #666;">
-                    Review Date: {date_display}
-                </div>
-                <div style="margin-top: 5px; font-size: 14px; color: #666;">
-                    Total Responses: {data['response_count']}
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            # Visible button below the card
-            button_key = f"card_btn_{account.replace(' ', '_').replace('(', '').replace(')', '').replace('/', '_').replace('.', '_')}"
-            if st.button(f"View Details", key=button_key, use_container_width=True, help=f"Click to view details for {account}"):
-                st.session_state['selected_account'] = account
-                st.rerun()
+def account_card_html(account, data, month=None):
+    """HTML for a single account card (no blank lines, so several cards can share one markdown call)"""
+    if not data['has_data']:
+        return _card_html(account, data['vertical'], False)
+    date_display = data['date'].strftime('%m/%d/%Y') if pd.notna(data['date']) else 'N/A'
+    # For December, make the entire card clickable
+    clickable = month in ("December_2025", "January_2026", "February_2026")
+    return _card_html(account, data['vertical'], True, data['score'], date_display, data['response_count'], clickable)
+
+@lru_cache(maxsize=256)  # Cards are rebuilt with the same content on every rerun
+def _card_html(account, vertical, has_data, score=None, date_display='N/A', response_count=0, clickable=False):
+    """Build the card HTML from plain hashable values"""
+    if not has_data:
+        return f"""<div class="account-card-no-data">
+<h3 style="margin: 0 0 10px 0; color: #1a1a1a;">{account}</h3>
+{vertical_badge_html(vertical)}
+<div style="margin-top: 15px; font-size: 16px; font-style: italic;">Data Not Collected Yet</div>
+</div>"""
+    
+    if score is not None:
+        if score >= 4.5:
+            score_class = "score-high"
+        elif score >= 3.5:
+            score_class = "score-medium"
         else:
-            # Original card rendering for non-December
-            st.markdown(f"""
-            <div class="account-card">
-                <h3 style="margin: 0 0 10px 0; color: #1a1a1a;">{account}</h3>
-                <div class="vertical-badge" style="background-color: {vertical_color};">{data['vertical']}</div>
-                <div style="margin-top: 15px;">
-                    <div style="font-size: 14px; color: #666;">Latest Score</div>
-                    <div>{score_display}</div>
-                </div>
-                <div style="margin-top: 10px; font-size: 14px; color: #666;">
-                    Review Date: {date_display}
-                </div>
-                <div style="margin-top: 5px; font-size: 14px; color: #666;">
-                    Total Responses: {data['response_count']}
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            # Add "View Details" button
-            if st.button("View Details", key=f"btn_{account}", use_container_width=True):
-                st.session_state['selected_account'] = account
-                st.session_state['switch_to_data_tab'] = True
-                st.rerun()
+            score_class = "score-low"
+        score_display = f'<span class="{score_class}">{score:.2f}</span>'
+    else:
+        score_display = '<span style="color: #999;">N/A</span>'
+    
+    card_style = ' style="cursor: pointer;"' if clickable else ''
+    return f"""<div class="account-card"{card_style}>
+<h3 style="margin: 0 0 10px 0; color: #1a1a1a;">{account}</h3>
+{vertical_badge_html(vertical)}
+<div style="margin-top: 15px;">
+<div style="font-size: 14px; color: #666;">Latest Score</div>
+<div>{score_display}</div>
+</div>
+<div style="margin-top: 10px; font-size: 14px; color: #666;">Review Date: {date_display}</div>
+<div style="margin-top: 5px; font-size: 14px; color: #666;">Total Responses: {response_count}</div>
+</div>"""
+
+def _select_account(account, switch_to_data_tab=False):
+    """Account selection button callback: runs before the click's rerun, so that run already shows the selection"""
+    st.session_state['selected_account'] = account
+    if switch_to_data_tab:
+        st.session_state['switch_to_data_tab'] = True
+
+def render_account_card_button(account, month=None):
+    """Render the "View Details" button that sits below an account card"""
+    if month in ("December_2025", "January_2026", "February_2026"):
+        # Visible button below the card
+        button_key = f"card_btn_{account.replace(' ', '_').replace('(', '').replace(')', '').replace('/', '_').replace('.', '_')}"
+        st.button(f"View Details", key=button_key, use_container_width=True, help=f"Click to view details for {account}",
+                  on_click=_select_account, args=(account,))
     else:
-        st.markdown(f"""
-        <div class="account-card-no-data">
-            <h3 style="margin: 0 0 10px 0; color: #1a1a1a;">{account}</h3>
-            <div class="vertical-badge" style="background-color: {vertical_color};">{data['vertical']}</div>
-            <div style="margin-top: 15px; font-size: 16px; font-style: italic;">
-                Data Not Collected Yet
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+        # Add "View Details" button
+        st.button("View Details", key=f"btn_{account}", use_container_width=True,
+                  on_click=_select_account, args=(account, True))
+
+# Score filter buckets: np.digitize against the edges gives 0 = below 3.5, 1 = 3.5 up to 4.5, 2 = 4.5 and up
+SCORE_BIN_EDGES = (3.5, 4.5)
+SCORE_FILTER_BINS = {"<3.5": 0, "3.5-4.5": 1, "4.5+": 2}
+
+# Session state defaults for the filters (legacy keys and sidebar widget keys) and the current view
+SESSION_DEFAULTS = {
+    'vertical_select': 'All',
+    'account_select': 'All',
+    'ifm_select': 'All',
+    'score_radio': "All Scores",
+    'vertical_select_sidebar': 'All',
+    'ifm_select_sidebar': 'All',
+    'current_view': 'cards',
+}
+
+# Month and score are read before their widgets are drawn, so widget changes are applied in on_change callbacks:
+# those run before the rerun the change triggers, which then renders the new selection without a second rerun
+def _apply_month_selection(display_to_key):
+    """Month selectbox callback"""
+    st.session_state['selected_month_display'] = st.session_state['month_select_sidebar']
+    st.session_state['selected_month_key'] = display_to_key[st.session_state['month_select_sidebar']]
+
+def _apply_score_selection():
+    """Score selectbox callback"""
+    st.session_state['score_radio'] = st.session_state['score_select_main']
+
+def _apply_nav_view(view):
+    """Navigation button callback"""
+    st.session_state['current_view'] = view
+    if view in ('cards', 'no_data'):
+        st.session_state['selected_account'] = None
+    if view == 'cards':
+        st.session_state.just_cleared_filters = True
+
+# Detailed Information expanders shown per page in the data view
+DETAIL_PAGE_SIZE = 25
 
 # Main app
 def main():
@@ -1451,7 +1477,7 @@ def main():
     st.markdown("---")
     
     # Get available months and set default to December 2025
-    available_months = get_available_months()
+    available_months = list(get_available_months())
     
     # Always include December 2025 for blank state
     if "December_2025" not in available_months:
@@ -1461,58 +1487,56 @@ def main():
     # Format for display
     month_display = {m: m.replace("_", " ").title() for m in available_months}
     month_options = list(month_display.values())
+    display_to_key = {v: k for k, v in month_display.items()}
     
     # Initialize selected month in session state - default to most recent (first in list)
     if 'selected_month' not in st.session_state:
         st.session_state['selected_month'] = month_options[0] if month_options else "November 2025"
     
-    # Get the selected month key (use session state or default to first available)
-    if 'selected_month_key' not in st.session_state:
+    # Get the selected month key (use session state or default to first available,
+    # also when the selected month's files have since been removed, so the Month selectbox always matches)
+    if st.session_state.get('selected_month_display') not in month_options:
         selected_month_display = month_options[0] if month_options else "November 2025"
-        selected_month_key = [k for k, v in month_display.items() if v == selected_month_display][0]
+        selected_month_key = display_to_key[selected_month_display]
         st.session_state['selected_month_key'] = selected_month_key
         st.session_state['selected_month_display'] = selected_month_display
     else:
         selected_month_key = st.session_state['selected_month_key']
         selected_month_display = st.session_state['selected_month_display']
     
-    # Load and process data for selected month
-    raw_df = load_data(month=selected_month_key)
+    # Load and process data for selected month. Filter-only reruns reuse this session's copy;
+    # it is reloaded only when the month or its source files change.
+    data_fingerprint = (selected_month_key, _source_files(selected_month_key)[1])
+    if st.session_state.get('month_data_fingerprint') == data_fingerprint:
+        processed_df, all_accounts, accounts_frame = st.session_state['month_data']
+    else:
+        processed_df, all_accounts = load_month_accounts(month=selected_month_key)
+        if processed_df is None:
+            # No data for this month: every account marked as having no data, kept with the session copy
+            all_accounts = get_all_accounts_with_data(pd.DataFrame())
+        accounts_frame = build_accounts_frame(all_accounts)
+        st.session_state['month_data_fingerprint'] = data_fingerprint
+        st.session_state['month_data'] = (processed_df, all_accounts, accounts_frame)
     
     # Handle blank state (no data for selected month)
-    if raw_df is None:
+    if processed_df is None:
         # Create empty dataframe to show blank state
         processed_df = pd.DataFrame()
         # Set flag to show message in main area
         st.session_state['show_blank_state_message'] = True
         st.session_state['blank_state_month'] = selected_month_display
     else:
-        processed_df = process_data(raw_df, month=selected_month_key)
         st.session_state['show_blank_state_message'] = False
     
-    # Get all accounts data
-    all_accounts = get_all_accounts_with_data(processed_df)
-    
     # Check if IFM data exists in processed data
     has_ifm_data = False
     if len(processed_df) > 0:
-        # Check if any row has non-empty IFM field
-        ifm_values = processed_df['IFM'].fillna('').astype(str).str.strip()
-        has_ifm_data = (ifm_values != '').any()
-    
-    # Initialize filter defaults
-    if 'vertical_select' not in st.session_state:
-        st.session_state['vertical_select'] = 'All'
-    if 'account_select' not in st.session_state:
-        st.session_state['account_select'] = 'All'
-    if 'ifm_select' not in st.session_state:
-        st.session_state['ifm_select'] = 'All'
-    if 'score_radio' not in st.session_state:
-        st.session_state['score_radio'] = "All Scores"
-    
-    # Get unique verticals
-    all_verticals = sorted(list(set(account_to_vertical.values())))
-    vertical_options = ['All'] + all_verticals
+        # Check if any row has non-empty IFM field (process_data already fills and strips it)
+        has_ifm_data = processed_df['IFM'].ne('').any()
+    
+    # Initialize filter and navigation defaults
+    for key, value in SESSION_DEFAULTS.items():
+        st.session_state.setdefault(key, value)
     
     # Sidebar filters
     st.sidebar.header("Filters")
@@ -1525,61 +1549,33 @@ def main():
     elif "December 2025" in month_options:
         month_index = month_options.index("December 2025")
     
-    selected_month_display = st.sidebar.selectbox(
+    st.sidebar.selectbox(
         "Month",
         month_options,
         index=month_index,
-        key='month_select_sidebar'
+        key='month_select_sidebar',
+        on_change=_apply_month_selection,
+        args=(display_to_key,)
     )
     
-    # Convert back to file format and update session state
-    new_selected_month_key = [k for k, v in month_display.items() if v == selected_month_display][0]
-    
-    # Reload data if month changed
-    if new_selected_month_key != selected_month_key:
-        st.session_state['selected_month_key'] = new_selected_month_key
-        st.session_state['selected_month_display'] = selected_month_display
-        st.rerun()
-    
     st.sidebar.markdown("---")
     
     # Vertical filter - use key to let Streamlit manage state
-    if 'vertical_select_sidebar' not in st.session_state:
-        st.session_state['vertical_select_sidebar'] = 'All'
-    
     selected_vertical = st.sidebar.selectbox(
         "Vertical",
-        vertical_options,
-        index=vertical_options.index(st.session_state['vertical_select_sidebar']) if st.session_state['vertical_select_sidebar'] in vertical_options else 0,
+        VERTICAL_OPTIONS,
+        index=VERTICAL_OPTIONS.index(st.session_state['vertical_select_sidebar']) if st.session_state['vertical_select_sidebar'] in VERTICAL_OPTIONS else 0,
         key='vertical_select_sidebar'
     )
     
     # IFM filter (only show if IFM data exists)
     # Filter IFM options based on selected vertical
     if has_ifm_data:
-        ifm_values = set()
-        
         # If a vertical is selected, only show IFM options for that vertical
-        if selected_vertical != 'All':
-            for account_name, account_data in all_accounts.items():
-                # Check if account belongs to selected vertical
-                if account_data.get('vertical') == selected_vertical:
-                    ifm_val = account_data.get('ifm', '')
-                    if ifm_val and str(ifm_val).strip():
-                        ifm_values.add(str(ifm_val).strip())
-        else:
-            # If "All" verticals selected, show all IFM options
-            for account_data in all_accounts.values():
-                ifm_val = account_data.get('ifm', '')
-                if ifm_val and str(ifm_val).strip():
-                    ifm_values.add(str(ifm_val).strip())
+        ifm_values = load_ifm_options(month=selected_month_key).get(selected_vertical, [])
         
         if ifm_values:
-            ifm_options = ['All'] + sorted(list(ifm_values))
-            
-            # Initialize IFM select state if not exists
-            if 'ifm_select_sidebar' not in st.session_state:
-                st.session_state['ifm_select_sidebar'] = 'All'
+            ifm_options = ['All'] + ifm_values
             
             # If vertical changed, reset IFM to 'All' if current selection not available
             if st.session_state['ifm_select_sidebar'] not in ifm_options:
@@ -1606,38 +1602,26 @@ def main():
     st.session_state['vertical_select'] = selected_vertical
     st.session_state['ifm_select'] = selected_ifm
     
-    # Start with all accounts - filters will be applied below
-    filtered_accounts = all_accounts
+    # Apply all filters as one boolean mask over the per-account frame instead of rebuilding the dict per filter
+    mask = pd.Series(True, index=accounts_frame.index)
     
     # Apply filters using the selectbox values directly
     if selected_vertical != 'All':
-        filtered_accounts = {k: v for k, v in filtered_accounts.items() if v['vertical'] == selected_vertical}
+        mask &= accounts_frame['vertical'] == selected_vertical
     
     if has_ifm_data and selected_ifm != 'All':
-        filtered_accounts = {
-            k: v for k, v in filtered_accounts.items()
-            if str(v.get('ifm', '')).strip() == selected_ifm
-        }
+        mask &= accounts_frame['ifm'] == selected_ifm
     
     # Apply score filter early in the filter chain
     if all_scores:
-        def score_in_category(score):
-            if score_filter == "All Scores":
-                return True
-            elif score_filter == "No Score":
-                return score is None
-            elif score_filter == "4.5+":
-                return score is not None and score >= 4.5
-            elif score_filter == "3.5-4.5":
-                return score is not None and 3.5 <= score < 4.5
-            elif score_filter == "<3.5":
-                return score is not None and score < 3.5
-            return True
-        
-        filtered_accounts = {
-            k: v for k, v in filtered_accounts.items() 
-            if v['has_data'] and score_in_category(v.get('score'))
-        }
+        score = pd.to_numeric(accounts_frame['score'], errors='coerce').to_numpy(dtype=float)
+        if score_filter == "No Score":
+            mask &= np.isnan(score)
+        elif score_filter in SCORE_FILTER_BINS:
+            mask &= ~np.isnan(score) & (np.digitize(score, SCORE_BIN_EDGES) == SCORE_FILTER_BINS[score_filter])
+        mask &= accounts_frame['has_data'].astype(bool)
+    
+    filtered_accounts = {k: all_accounts[k] for k in accounts_frame.index[mask]}
     
     # Show blank state message if needed
     if st.session_state.get('show_blank_state_message', False):
@@ -1645,20 +1629,22 @@ def main():
         st.markdown("---")
     
     
-    # Calculate metrics AFTER filters are applied
-    accounts_with_data = {k: v for k, v in filtered_accounts.items() if v['has_data']}
+    # Calculate metrics AFTER filters are applied - column reductions over the filtered rows of the accounts frame
+    has_data = accounts_frame['has_data'].astype(bool)
+    with_data_frame = accounts_frame[mask & has_data]
+    accounts_with_data = {k: all_accounts[k] for k in with_data_frame.index}
     # For "no data" view, always use all_accounts to show true missing data
-    accounts_without_data = {k: v for k, v in all_accounts.items() if not v['has_data']}
+    accounts_without_data = {k: all_accounts[k] for k in accounts_frame.index[~has_data]}
     
     total_accounts = len(filtered_accounts)
-    total_responses = sum(v['response_count'] for v in accounts_with_data.values())
+    total_responses = int(with_data_frame['response_count'].sum())
     
-    scores = [v['score'] for v in accounts_with_data.values() if v['score'] is not None and pd.notna(v['score'])]
-    avg_score = sum(scores) / len(scores) if scores else 0
+    scores = pd.to_numeric(with_data_frame['score'], errors='coerce')
+    avg_score = scores.mean() if scores.notna().any() else 0
     
     # Get latest date
-    dates = [v['completion_date'] for v in accounts_with_data.values() if pd.notna(v.get('completion_date'))]
-    latest_date = max(dates).strftime('%m/%d/%Y') if dates else 'N/A'
+    completion_dates = pd.to_datetime(with_data_frame['completion_date'])
+    latest_date = completion_dates.max().strftime('%m/%d/%Y') if completion_dates.notna().any() else 'N/A'
     
     # Display summary metrics
     col1, col2, col3 = st.columns(3)
@@ -1674,61 +1660,30 @@ def main():
     
     st.markdown("---")
     
-    # Initialize navigation state
-    if 'current_view' not in st.session_state:
-        st.session_state['current_view'] = 'cards'
-    
     # Check if we should switch to data table view
     if st.session_state.get('switch_to_data_tab'):
         st.session_state['current_view'] = 'data'
         st.session_state['switch_to_data_tab'] = False
+    # Read once: navigation buttons apply the new view in their on_click callback, before this run starts
+    current_view = st.session_state['current_view']
     
     # Navigation buttons with sticky positioning (Insights tab for new-format months)
     is_new_format_month = selected_month_key in ("December_2025", "January_2026", "February_2026")
     
+    nav_views = [("Account Cards", 'cards', "nav_cards"), ("Data Table", 'data', "nav_data")]
     if is_new_format_month:
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            if st.button("Account Cards", use_container_width=True, type="primary" if st.session_state['current_view'] == 'cards' else "secondary", key="nav_cards"):
-                st.session_state['current_view'] = 'cards'
-                st.session_state['selected_account'] = None
-                st.session_state.just_cleared_filters = True
-                st.rerun()
-        with col2:
-            if st.button("Data Table", use_container_width=True, type="primary" if st.session_state['current_view'] == 'data' else "secondary", key="nav_data"):
-                st.session_state['current_view'] = 'data'
-                st.rerun()
-        with col3:
-            if st.button("Insights", use_container_width=True, type="primary" if st.session_state['current_view'] == 'insights' else "secondary", key="nav_insights"):
-                st.session_state['current_view'] = 'insights'
-                st.rerun()
-        with col4:
-            if st.button("Accounts Without Data", use_container_width=True, type="primary" if st.session_state['current_view'] == 'no_data' else "secondary", key="nav_nodata"):
-                st.session_state['current_view'] = 'no_data'
-                st.session_state['selected_account'] = None
-                st.rerun()
-    else:
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            if st.button("Account Cards", use_container_width=True, type="primary" if st.session_state['current_view'] == 'cards' else "secondary", key="nav_cards"):
-                st.session_state['current_view'] = 'cards'
-                st.session_state['selected_account'] = None
-                st.session_state.just_cleared_filters = True
-                st.rerun()
-        with col2:
-            if st.button("Data Table", use_container_width=True, type="primary" if st.session_state['current_view'] == 'data' else "secondary", key="nav_data"):
-                st.session_state['current_view'] = 'data'
-                st.rerun()
-        with col3:
-            if st.button("Accounts Without Data", use_container_width=True, type="primary" if st.session_state['current_view'] == 'no_data' else "secondary", key="nav_nodata"):
-                st.session_state['current_view'] = 'no_data'
-                st.session_state['selected_account'] = None
-                st.rerun()
+        nav_views.append(("Insights", 'insights', "nav_insights"))
+    nav_views.append(("Accounts Without Data", 'no_data', "nav_nodata"))
+    
+    for col, (label, view, key) in zip(st.columns(len(nav_views)), nav_views):
+        with col:
+            st.button(label, use_container_width=True, type="primary" if current_view == view else "secondary", key=key,
+                      on_click=_apply_nav_view, args=(view,))
     
     st.markdown("---")
     
     # Show content based on current view
-    if st.session_state['current_view'] == 'cards':
+    if current_view == 'cards':
         # Check if new-format month and account is selected (detail view)
         is_new_format = selected_month_key in ("December_2025", "January_2026", "February_2026")
         selected_account = st.session_state.get('selected_account', None)
@@ -1748,17 +1703,13 @@ def main():
                     current_score = st.session_state.get('score_radio', "All Scores")
                     score_index = 0 if current_score == "All Scores" else (score_options.index(current_score) if current_score in score_options else 0)
                     
-                    new_score_filter = st.selectbox(
+                    st.selectbox(
                         "Score",
                         score_options,
                         index=score_index,
-                        key='score_select_main'
+                        key='score_select_main',
+                        on_change=_apply_score_selection
                     )
-                    
-                    # If score filter changed, update session state and rerun
-                    if new_score_filter != score_filter:
-                        st.session_state['score_radio'] = new_score_filter
-                        st.rerun()
             
             if len(accounts_with_data) == 0:
                 st.info("No accounts with data for the selected filters.")
@@ -1768,14 +1719,16 @@ def main():
                 accounts_list = list(accounts_with_data.items())
                 
                 for i in range(0, len(accounts_list), cols_per_row):
+                    row = accounts_list[i:i + cols_per_row]
+                    # One markdown call per row of cards; only the buttons below them are separate widgets
+                    cards_html = "\n".join(account_card_html(account, data, month=selected_month_key) for account, data in row)
+                    st.markdown(f'<div class="account-card-row">\n{cards_html}\n</div>', unsafe_allow_html=True)
                     cols = st.columns(cols_per_row)
-                    for j, col in enumerate(cols):
-                        if i + j < len(accounts_list):
-                            account, data = accounts_list[i + j]
-                            with col:
-                                render_account_card(account, data, month=selected_month_key)
+                    for col, (account, data) in zip(cols, row):
+                        with col:
+                            render_account_card_button(account, month=selected_month_key)
     
-    elif st.session_state['current_view'] == 'data':
+    elif current_view == 'data':
         st.subheader("Detailed Data Table")
         
         # Check if we should show a message about selected account
@@ -1784,40 +1737,61 @@ def main():
             st.info(f"📍 Showing details for: **{selected_account}**")
         elif selected_account and selected_account not in accounts_with_data:
             # Account was selected but is now filtered out - clear it
-            st.session_state['selected_account'] = None
+            st.session_state['selected_account'] = selected_account = None
         
         if len(accounts_with_data) == 0:
             st.info("No data available.")
         else:
-            # Prepare table data
-            table_data = []
-            for account, data in accounts_with_data.items():
-                table_data.append({
-                    'Account': account,
-                    'Vertical': data['vertical'],
-                    'Score': f"{data['score']:.2f}" if data['score'] is not None else 'N/A',
-                    'Review Date': data['date'].strftime('%m/%d/%Y') if pd.notna(data['date']) else 'N/A',
-                    'Account Director': data.get('account_director', 'N/A')
-                })
+            # Prepare table data column by column (with_data_frame rows are in the same order as accounts_with_data).
+            # Scores and dates keep their dtypes so the table sorts them correctly; the browser formats them.
+            review_date_col = pd.to_datetime(with_data_frame['date'])
+            table_df = pd.DataFrame({
+                'Account': with_data_frame.index,
+                'Vertical': with_data_frame['vertical'],
+                'Score': pd.to_numeric(with_data_frame['score'], errors='coerce'),
+                'Review Date': review_date_col,
+                'Account Director': [data.get('account_director', 'N/A') for data in accounts_with_data.values()]
+            })
+            st.dataframe(table_df, use_container_width=True, hide_index=True, column_config={
+                'Score': st.column_config.ProgressColumn(format='%.2f', min_value=0, max_value=5),
+                'Review Date': st.column_config.DatetimeColumn(format='MM/DD/YYYY'),
+            })
             
-            table_df = pd.DataFrame(table_data)
-            st.dataframe(table_df, use_container_width=True, hide_index=True)
+            # Review dates and scores as the detail expanders show them
+            review_dates = review_date_col.dt.strftime('%m/%d/%Y').fillna('N/A').to_dict()
+            score_strs = {
+                account: f"{data['score']:.2f}" if pd.notna(data['score']) else 'N/A'
+                for account, data in accounts_with_data.items()
+            }
             
             # Expandable detailed view
             st.markdown("### Detailed Information")
             
-            # Get selected account from session state
-            selected_account = st.session_state.get('selected_account', None)
+            # Only one page of expanders is sent to the browser; a selected account is shown on its own
+            detail_items = sorted(accounts_with_data.items())
+            if selected_account in accounts_with_data:
+                detail_items = [(selected_account, accounts_with_data[selected_account])]
+            elif len(detail_items) > DETAIL_PAGE_SIZE:
+                page_count = -(-len(detail_items) // DETAIL_PAGE_SIZE)
+                page = st.selectbox("Page", range(1, page_count + 1), format_func=lambda p: f"Page {p} of {page_count}", key='detail_page')
+                detail_items = detail_items[(page - 1) * DETAIL_PAGE_SIZE:page * DETAIL_PAGE_SIZE]
+            
+            # Per-account headline strings materialized before rendering the expanders
+            detail_rows = [
+                (account, data, f"**Score:** {score_strs[account]}", f"**Review Date:** {review_dates[account]}")
+                for account, data in detail_items
+            ]
             
-            for account, data in sorted(accounts_with_data.items()):
+            for account, data, score_line, date_line in detail_rows:
                 # Auto-expand if this is the selected account
                 is_expanded = (account == selected_account)
                 
-                with st.expander(f"{account} - {data['vertical']}", expanded=is_expanded):
+                # Keyed per account so the same entry keeps its identity across pages and filter changes
+                with st.container(key=f"detail_{account}"), st.expander(f"{account} - {data['vertical']}", expanded=is_expanded):
                     col1, col2 = st.columns(2)
                     with col1:
-                        st.markdown(f"**Score:** {data['score']:.2f}" if data['score'] else "**Score:** N/A")
-                        st.markdown(f"**Review Date:** {data['date'].strftime('%m/%d/%Y') if pd.notna(data['date']) else 'N/A'}")
+                        st.markdown(score_line)
+                        st.markdown(date_line)
                         st.markdown(f"**Responses:** {data['response_count']}")
                     with col2:
                         st.markdown(f"**Account Director:** {data.get('account_director', 'N/A')}")
@@ -1825,30 +1799,36 @@ def main():
                     st.markdown("**Attendees:**")
                     st.write(data.get('attendees', 'N/A'))
                     
+                    # Expanders are sent to the browser even when collapsed, so long texts go as previews
+                    # unless this is the selected account or the full text is asked for
+                    texts = [data.get(field, 'N/A') for field in ('summary', 'feedback', 'action_items')]
+                    if not is_expanded and any(text_preview(text) is not text for text in texts):
+                        if not st.checkbox("Show full text", key=f"full_text_{account}"):
+                            texts = [text_preview(text) for text in texts]
+                    summary, feedback, action_items = texts
+                    
                     st.markdown("**Summary:**")
-                    st.write(data.get('summary', 'N/A'))
+                    st.write(summary)
                     
                     st.markdown("**Customer Feedback:**")
-                    st.write(data.get('feedback', 'N/A'))
+                    st.write(feedback)
                     
                     st.markdown("**Action Items:**")
-                    st.write(data.get('action_items', 'N/A'))
+                    st.write(action_items)
             
             # Clear selected account after rendering
             if selected_account:
                 # Add a button to clear the selection
-                if st.button("🔄 Clear Selection"):
-                    st.session_state['selected_account'] = None
-                    st.rerun()
+                st.button("🔄 Clear Selection", on_click=_select_account, args=(None,))
     
-    elif st.session_state['current_view'] == 'insights':
+    elif current_view == 'insights':
         # Show insights for new-format months (Dec 2025, Jan 2026, Feb 2026)
         if selected_month_key in ("December_2025", "January_2026", "February_2026"):
             render_december_insights(processed_df, all_accounts, accounts_with_data, month_key=selected_month_key)
         else:
             st.info("Insights are only available for December 2025, January 2026, and February 2026 data.")
     
-    elif st.session_state['current_view'] == 'no_data':
+    elif current_view == 'no_data':
         st.subheader("Accounts Without Data")
         
         if len(accounts_without_data) == 0:
@@ -1856,26 +1836,23 @@ def main():
         else:
             st.info(f"**{len(accounts_without_data)}** accounts are awaiting data collection.")
             
-            # Group by vertical
+            # Group by vertical; accounts are sorted once up front so every group is already in order
             by_vertical = {}
-            for account, data in accounts_without_data.items():
-                vertical = data['vertical']
-                if vertical not in by_vertical:
-                    by_vertical[vertical] = []
-                by_vertical[vertical].append(account)
+            for account in sorted(accounts_without_data):
+                by_vertical.setdefault(accounts_without_data[account]['vertical'], []).append(account)
             
             # Display by vertical
-            for vertical in sorted(by_vertical.keys()):
+            for vertical in sorted(by_vertical):
                 with st.expander(f"**{vertical}** ({len(by_vertical[vertical])} accounts)"):
-                    for account in sorted(by_vertical[vertical]):
-                        st.markdown(f"- {account}")
+                    # One markdown list per vertical rather than an element per account
+                    st.markdown("\n".join(f"- {account}" for account in by_vertical[vertical]))
     
-    elif st.session_state['current_view'] == 'detail':
+    elif current_view == 'detail':
         st.subheader("Complete Scorecard Detail View")
         st.markdown("View all questions and answers from the CSV for a specific account.")
         
         # Account selector for detail view
-        detail_account_options = ['Select an account...'] + sorted([k for k, v in accounts_with_data.items()])
+        detail_account_options = ['Select an account...'] + sorted(accounts_with_data)
         selected_detail_account = st.selectbox(
             "Select Account to View Details",
             detail_account_options,
@@ -1937,14 +1914,13 @@ def main():
                 
                 # Also show as raw JSON for debugging
                 with st.expander("🔧 Raw Data (JSON)", expanded=False):
-                    import json
                     # Convert to JSON-serializable format
                     json_data = {}
                     for k, v in raw_data.items():
                         if pd.notna(v):
                             try:
                                 json_data[k] = str(v)
-                            except:
+                            except Exception:
                                 json_data[k] = "Unable to serialize"
                     st.json(json_data)
             else:
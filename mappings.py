@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 # Account name (canonical) -> Vertical. Source: user-provided list.
 # For dual-vertical entries (Geico, Siemens, Siemens Healthineers), first listed vertical is used.
 account_to_vertical = {
@@ -105,130 +107,77 @@ account_to_vertical = {
     "Great American Ball Park": "R&D / Education / Other",
 }
 
-# Maps CSV / form variations to canonical account names (must exist in account_to_vertical)
+# Maps CSV / form variations to canonical account names (must exist in account_to_vertical).
+# Matched case-insensitively, so each variation needs only one spelling.
 account_name_variations = {
     "Abbvie": "AbbVie",
-    "abbvie": "AbbVie",
     "Abbottt": "Abbott Labs",
-    "abbottt": "Abbott Labs",
     "Abbott": "Abbott Labs",
-    "abbott": "Abbott Labs",
     "3M": "3M Corp",
     "Ball Corp": "Ball Corporation",
-    "ball corp": "Ball Corporation",
     "Cigna": "CIGNA",
-    "cigna": "CIGNA",
     "Elevance": "Elevance Health",
-    "elevance": "Elevance Health",
-    "T.Rowe Price": "T Rowe Price",
-    "t.rowe price": "T Rowe Price",
     "T.Rowe Price": "T Rowe Price",
     "t rowe price": "T Rowe Price",
     "State Farm": "State Farm Ins",
-    "state farm": "State Farm Ins",
     "Adobe Systems": "Adobe",
     "adobe": "Adobe",
     "Lam Research": "LAM Research",
-    "lam research": "LAM Research",
     "Eli Lilly LCC/LRL": "Eli Lilly",
-    "eli lilly lcc/lrl": "Eli Lilly",
     "eli lilly": "Eli Lilly",
     "IQVIA": "IQVIA Biotech",
-    "iqvia": "IQVIA Biotech",
     "IQVIA/CBRE": "IQVIA Biotech",
-    "iqvia/cbre": "IQVIA Biotech",
     "IQVIA/CBRE (CBRE)": "IQVIA Biotech",
     "Tesla": "Tesla Inc - Jacob Reed",
-    "tesla": "Tesla Inc - Jacob Reed",
     "Tesla Inc.": "Tesla Inc - Jacob Reed",
     "GM Milford": "General Motors",
-    "gm milford": "General Motors",
     "GM Grand Rapids": "General Motors",
-    "gm grand rapids": "General Motors",
     "Grant frazier": "Meta",
-    "grant frazier": "Meta",
     "Microsoft Puget Sound": "Microsoft",
-    "microsoft puget sound": "Microsoft",
     "Microsoft Datacenters": "Microsoft",
-    "microsoft datacenters": "Microsoft",
     "Boeing": "Boeing Company",
-    "boeing": "Boeing Company",
     "JLL Northrop Grumman": "Northrop Grumman",
     "Wells Fargo-JLL": "Wells Fargo",
-    "wells fargo-jll": "Wells Fargo",
     "GE Healthcare - All Sites": "GE Healthcare",
-    "ge healthcare - all sites": "GE Healthcare",
     "Johnson & Johnson JLL": "Johnson & Johnson",
-    "johnson & johnson jll": "Johnson & Johnson",
     "J&J JLL": "Johnson & Johnson",
     "Nestle - St. Louis": "Nestle",
-    "nestle - st. louis": "Nestle",
     "Daimler - Detroit Diesel": "Detroit Diesel (DDC)",
-    "daimler - detroit diesel": "Detroit Diesel (DDC)",
     "P&G(JLL)": "Procter & Gamble Company",
-    "p&g(jll)": "Procter & Gamble Company",
     "P&G": "Procter & Gamble Company",
-    "p&g": "Procter & Gamble Company",
     "Micron (C&W)": "Micron Tech",
-    "micron (c&w)": "Micron Tech",
     "Great American Ballpark": "Great American Ball Park",
-    "great american ballpark": "Great American Ball Park",
     "Merck Sodexo": "Merck Sodexo",
-    "merck sodexo": "Merck Sodexo",
     "Merck CBRE": "Merck CBRE",
-    "merck cbre": "Merck CBRE",
     "Merck/CBRE": "Merck CBRE",
-    "merck/cbre": "Merck CBRE",
     "Merck/CBRE All Locations": "Merck CBRE",
-    "merck/cbre all locations": "Merck CBRE",
     "Takeda (CBRE)": "Takeda Pharmaceutical",
-    "takeda (cbre)": "Takeda Pharmaceutical",
     "Honda": "Honda Motor Company",
-    "honda": "Honda Motor Company",
     "Gilead": "Gilead Sciences",
-    "gilead": "Gilead Sciences",
     "Gilead Oceanside": "Gilead Sciences",
-    "gilead oceanside": "Gilead Sciences",
     "BMS": "Bristol Myers Squibb",
-    "bms": "Bristol Myers Squibb",
     "BI": "Boehringer Ingelheim",
-    "bi": "Boehringer Ingelheim",
     "Altera": "Altera",
-    "altera": "Altera",
     "CBRE/Nvidia": "NVIDIA",
-    "cbre/nvidia": "NVIDIA",
     "Organon/CBRE": "Organon",
-    "organon/cbre": "Organon",
     "Pfizer Memphis": "Pfizer",
-    "pfizer memphis": "Pfizer",
     "Pfizer (JLL)": "Pfizer",
-    "pfizer (jll)": "Pfizer",
     "Lonza JLL": "Lonza Biologics",
-    "lonza jll": "Lonza Biologics",
     "Lonza": "Lonza Biologics",
-    "lonza": "Lonza Biologics",
     "Lonza Vacaville / Lonza Biologics": "Lonza Biologics",
-    "lonza vacaville / lonza biologics": "Lonza Biologics",
     "Genentech HTO": "Genentech",
     "Genentech HIT": "Genentech",
     "Genentech HTO / Genentech": "Genentech",
-    "genentech hto / genentech": "Genentech",
     "Cardinal Helth": "Cardinal Health",
     "Google Bay & San Francisco": "Google",
-    "google bay & san francisco": "Google",
     # Nike / GXO / DHL variants
     "Nike/DHL": "Nike",
-    "nike/dhl": "Nike",
     "Nike/GXO Relay": "Nike",
     "Nike/GXO Relay (California)": "Nike",
-    "nike/gxo relay": "Nike",
     "Nike/GXO Connect": "Nike",
     "Nike/GXO  Connect": "Nike",
-    "nike/gxo connect": "Nike",
     "Nike/NALC": "Nike",
-    "nike/nalc": "Nike",
     "Nike/Adapt": "Nike",
-    "nike/adapt": "Nike",
     "Nike Adapt": "Nike",
     "GXO/Nike": "Nike",
     "GXO/Nike Connect": "Nike",
@@ -236,18 +185,23 @@ account_name_variations = {
     "GXO Nike Relay Bloomington, CA": "Nike",
     "NIKE/DHL Dash": "Nike",
     "DHL/NIKE Dash": "Nike",
-    "DHL/NIKE DASH": "Nike",
     "DHL/Nike (Dash)": "Nike",
-    "dhl/nike (dash)": "Nike",
     "DHL/Nike (Dash) (Direct)": "Nike",
     "Edged Energy (JLL)": "Edged Energy",
-    "edged energy (jll)": "Edged Energy",
-    "Nike/NALC": "Nike",
-    "NIKE/NALC": "Nike",
-    "NIKE/ADAPT": "Nike",
-    "GXO/NIKE": "Nike",
     "GXO/NIKE Conn ct": "Nike",
     "Relay": "Nike",
     "Connect": "Nike",
     "Omnicom": None,
 }
+
+# Case-insensitive resolver table, built once at import: casefolded canonical names map to themselves,
+# then variations override (None = omit the account)
+_ACCOUNT_LOOKUP = {name.casefold(): name for name in account_to_vertical}
+_ACCOUNT_LOOKUP.update((alias.casefold(), canonical) for alias, canonical in account_name_variations.items())
+
+# Called with the same few spellings on every CSV load
+@lru_cache(maxsize=1024)
+def resolve_account(name):
+    """Canonical account name for a CSV spelling (None = omit the account); unknown names come back stripped but unchanged"""
+    name = name.strip()
+    return _ACCOUNT_LOOKUP.get(name.casefold(), name)